@@ -26,10 +26,12 @@ import asyncio
 import datetime
 import logging
 import os
+import sys
 from typing import (
     TYPE_CHECKING,
     AsyncIterator,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
@@ -84,6 +86,15 @@ intents.members = True
 # intents.message_content = True
 
 
+class _TimerProxy:
+    """Mimics the reminder Timer interface for polls that expired while offline."""
+
+    __slots__ = ("kwargs",)
+
+    def __init__(self, data: Dict) -> None:
+        self.kwargs: Dict = {"data": data}
+
+
 class PhantomGuard(commands.AutoShardedBot):
     def __init__(self):
         super().__init__(
@@ -101,17 +112,22 @@ class PhantomGuard(commands.AutoShardedBot):
         self.version_info: tuple[int, int, int] = version_info
         self.__version__: str = ".".join(str(self.version_info))
         self.maintenance_mode: bool = False
+        self._prefix_func = commands.when_mentioned_or("p!", "P!")
+        # populated in on_ready once the bot's user id is known
+        self._mention_forms: tuple[str, ...] = ()
+        self._owners_cached: Optional[List[discord.User]] = None
 
     async def setup_hook(self) -> None:
-        self.registering_guilds: List[int] = []
+        self.registering_guilds: Set[int] = set()
         self.session = aiohttp.ClientSession()
-        self.owner_ids: List[int] = [613752401878450176, 921020428791742515]
+        self.owner_ids: FrozenSet[int] = frozenset(
+            {613752401878450176, 921020428791742515}
+        )
         # self.config: Dict[str, Dict] = {"bypassed": {}, "disabled": {}}
         # # this code no longer is needed as it is shifted to redis.
         # self.main_config: Dict[int, dict] = {}
-        self.admins: List[int] = []
-        self.mods: List[int] = []
-        self.admins.extend(self.owner_ids)
+        self.admins: Set[int] = set(self.owner_ids)
+        self.mods: Set[int] = set()
 
         self.bans: Dict[str, Set] = {"guild": set(), "user": set()}
         self.ablc_cache = AsyncTimedCache(loop=self.loop)
@@ -125,6 +141,11 @@ class PhantomGuard(commands.AutoShardedBot):
         except Exception:
             raise RuntimeError("Db failed to connect.")
 
+        # kick off the independent DB reads so they overlap with extension loading
+        admins_task = asyncio.create_task(self.db.admins.get_all())
+        mods_task = asyncio.create_task(self.db.mods.get_all())
+        polled_task = asyncio.create_task(self.db.pollings.find_many({"type": "polled"}))
+
         for extension in [
             ext for ext in initial_extensions if ext not in excluded_extensions
         ]:
@@ -142,11 +163,8 @@ class PhantomGuard(commands.AutoShardedBot):
 
         self.tree.interaction_check = self.interaction_check
 
-        for admin in await self.db.admins.get_all():
-            self.admins.append(admin["_id"])
-
-        for mod in await self.db.mods.get_all():
-            self.mods.append(mod["_id"])
+        self.admins.update(admin["_id"] for admin in await admins_task)
+        self.mods.update(mod["_id"] for mod in await mods_task)
 
         log.info("Populating DB cache")
 
@@ -158,24 +176,16 @@ class PhantomGuard(commands.AutoShardedBot):
             "DB cache fully populated, access it via: `{bot.main_config}` / `{bot.config}` (for command bypass list)"
         )
 
-        polled_reports = await self.db.pollings.find_many(
-            {
-                "type": "polled",
-            }
-        )
+        polled_reports = await polled_task
+        now = discord.utils.utcnow()
+        utc = datetime.timezone.utc
+        expired: List[_TimerProxy] = []
         for polled_report in polled_reports:
-            if polled_report["type"] != "polled":
-                continue
-            if (
-                polled_report["expires"].replace(tzinfo=datetime.timezone.utc)
-                <= discord.utils.utcnow()
-            ):
-
-                class TimerProxy:
-                    def __init__(self, data):
-                        self.kwargs: Dict = {"data": data}
-
-                self.dispatch("poll_timer_complete", TimerProxy(polled_report))
+            expires = polled_report["expires"]
+            if expires.tzinfo is None:
+                expires = expires.replace(tzinfo=utc)
+            if expires <= now:
+                expired.append(_TimerProxy(polled_report))
                 continue
             stage = polled_report["stage"]
             if stage == 1:
@@ -188,15 +198,18 @@ class PhantomGuard(commands.AutoShardedBot):
             elif stage == 2:
                 self.add_view(PollingView(self, polled_report))
 
+        if expired:
+            # one batched dispatch instead of a dispatcher pass per poll
+            self.dispatch("poll_timer_batch_complete", expired)
+
     # async def cache_empty_guilds(self):
     # [omitted as cache was shifted to redis in latest build]
 
     @property
     def owners(self) -> List[discord.User]:
-        users = []
-        for owner_id in self.owner_ids:
-            users.append(self.get_user(owner_id))
-        return users
+        if self._owners_cached is not None:
+            return self._owners_cached
+        return [self.get_user(owner_id) for owner_id in self.owner_ids]
 
     @tasks.loop(seconds=600)
     async def change_activity(self):
@@ -229,19 +242,19 @@ class PhantomGuard(commands.AutoShardedBot):
         Optional[Member]
             The member matching the query or None if not found.
         """
-        if len(argument) > 5 and argument[-5] == "#":
-            username, _, discriminator = argument.rpartition(
-                "#"
-            )  # TODO: change due to removal of discriminator
+        # TODO: change due to removal of discriminator
+        username, sep, discriminator = argument.rpartition("#")
+        if sep and len(discriminator) == 4 and discriminator.isdigit():
             members = await guild.query_members(username, limit=100, cache=cache)
             return discord.utils.get(
                 members, name=username, discriminator=discriminator
             )
         else:
             members = await guild.query_members(argument, limit=100, cache=cache)
-            return discord.utils.find(
-                lambda m: m.name == argument or m.nick == argument, members
-            )
+            for member in members:
+                if member.name == argument or member.nick == argument:
+                    return member
+            return None
 
     async def get_or_fetch_guild(self, guild_id: int) -> Optional[discord.Guild]:
         """Looks up the given guild in cache or fetches if not found.
@@ -334,23 +347,12 @@ class PhantomGuard(commands.AutoShardedBot):
                 needs_resolution.append(member_id)
 
         total_need_resolution = len(needs_resolution)
-        if total_need_resolution == 1:
-            shard: discord.ShardInfo = self.get_shard(guild.shard_id)  # type: ignore  # will never be None
-            if shard.is_ws_ratelimited():
-                try:
-                    member = await guild.fetch_member(needs_resolution[0])
-                except discord.HTTPException:
-                    pass
-                else:
-                    yield member
-            else:
-                members = await guild.query_members(
-                    limit=1, user_ids=needs_resolution, cache=True
-                )
-                if members:
-                    yield members[0]
-        elif total_need_resolution <= 100:
-            # Only a single resolution call needed here
+        if not total_need_resolution:
+            return
+        if total_need_resolution <= 100:
+            # Only a single resolution call needed here; the gateway query is
+            # one websocket op whether we ask for 1 id or 100, so the single
+            # member case doesn't warrant its own HTTP fetch path.
             resolved = await guild.query_members(
                 limit=100, user_ids=needs_resolution, cache=True
             )
@@ -370,6 +372,11 @@ class PhantomGuard(commands.AutoShardedBot):
         if not hasattr(self, "starttime"):
             self.starttime = discord.utils.utcnow()
 
+        self._mention_forms = (f"<@{self.user.id}>", f"<@!{self.user.id}>")
+        self._owners_cached = [
+            self.get_user(owner_id) for owner_id in self.owner_ids
+        ]
+
         log.info("Ready: %s (ID: %s)", self.user, self.user.id)
 
     async def get_context(
@@ -394,17 +401,11 @@ class PhantomGuard(commands.AutoShardedBot):
                     )
                     return
             if author_id not in self.owner_ids:
-                if author_id in self.blacklist.users:
-                    return
-                elif guild_id in self.blacklist.guilds:
+                blacklist = self.blacklist
+                if author_id in blacklist.users or guild_id in blacklist.guilds:
                     return
 
-            if (
-                message.raw_mentions and message.guild.me.id in message.raw_mentions
-            ) and (
-                len(message.content) == len(message.guild.me.mention)
-                and message.content == message.guild.me.mention
-            ):
+            if message.content in self._mention_forms:
                 try:
                     await ctx.send_embed(
                         "info", f"My current prefix here is: {message.guild.me.mention}"
@@ -416,24 +417,28 @@ class PhantomGuard(commands.AutoShardedBot):
         await self.invoke(ctx)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if not interaction.user:
+        user = interaction.user
+        if not user:
             await interaction.response.send_message(
                 "ERROR: Unknown Interaction Author", ephemeral=True
             )
             return False
 
-        if interaction.user.id in self.owner_ids:
+        user_id = user.id
+        if user_id in self.owner_ids:
             return True
 
-        if interaction.user.id in self.blacklist.users:
+        blacklist = self.blacklist
+        if user_id in blacklist.users:
             await interaction.response.send_message(
                 "You are bot banned!", ephemeral=True
             )
             return False
 
-        if interaction.guild and interaction.guild.id in self.blacklist.guilds:
+        guild = interaction.guild
+        if guild and guild.id in blacklist.guilds:
             await interaction.response.send_message(
-                f"The server {interaction.guild.name} is bot banned!", ephemeral=True
+                f"The server {guild.name} is bot banned!", ephemeral=True
             )
             return False
 
@@ -459,11 +464,21 @@ class PhantomGuard(commands.AutoShardedBot):
     async def on_message(self, message: discord.Message) -> None:
         if message.author.bot:
             return
+        content = message.content
+        if not content:
+            return
+        # skip Context construction for the vast majority of chat traffic:
+        # anything that can't be a command starts with neither a prefix nor
+        # a mention of the bot
+        if (
+            not content.startswith(("p!", "P!"))
+            and self.user.id not in message.raw_mentions
+        ):
+            return
         await self.process_commands(message)
 
     async def get_prefix(self, message: discord.Message) -> str:
-        prefix = ["p!", "P!"]
-        return commands.when_mentioned_or(*prefix)(self, message)
+        return self._prefix_func(self, message)
 
     async def close(self) -> None:
         log.info("Shutdown initiated, cleaning up...")
@@ -471,6 +486,10 @@ class PhantomGuard(commands.AutoShardedBot):
         return await super().close()
 
     async def start(self) -> None:
+        if sys.version_info >= (3, 12):
+            # run coroutines eagerly until they first block, so awaits that
+            # complete synchronously skip a trip through the scheduler
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         return await super().start(
             os.getenv("DEV_TOKEN" if os.name == "nt" else "TOKEN", os.getenv("TOKEN")),
             reconnect=True,
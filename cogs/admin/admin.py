@@ -31,6 +31,7 @@ from discord.ext import commands
 
 from utils.checks import is_botadmin
 from utils.context import Context
+from utils.simple_cache import AsyncTimedCache
 
 if TYPE_CHECKING:
     from bot import PhantomGuard
@@ -40,6 +41,7 @@ if TYPE_CHECKING:
 class Admin(commands.Cog):
     def __init__(self, bot: PhantomGuard) -> None:
         self.bot: PhantomGuard = bot
+        self.poll_cache = AsyncTimedCache(timeout=60, loop=bot.loop)
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -51,23 +53,28 @@ class Admin(commands.Cog):
     async def ping_on_role(self, before: discord.Member, after: discord.Member) -> None:
         member_role = after.guild.get_role(1229192658551836792)
         if member_role not in before.roles and member_role in after.roles:
-            channels = [
+            channels = (
                 1239343025474506894,  # about
                 1228764652767416363,  # role
                 1229425336807329853,  # register
                 1239541902467006484,  # guide
                 1239052941059686431,  # staff-apply
-            ]
-            tasks = [
-                chan.send(
-                    after.mention,
-                    delete_after=1,
-                    allowed_mentions=discord.AllowedMentions(users=[after]),
+            )
+            get_channel = after.guild.get_channel
+            mentions = discord.AllowedMentions(users=[after])
+            for channel_id in channels:
+                chan = get_channel(channel_id)
+                if chan is None:
+                    continue
+                # fire-and-forget so the listener returns immediately and the
+                # sends proceed concurrently in the background
+                asyncio.create_task(
+                    chan.send(
+                        after.mention,
+                        delete_after=1,
+                        allowed_mentions=mentions,
+                    )
                 )
-                for chan in [after.guild.get_channel(c) for c in channels]
-                if chan
-            ]
-            await asyncio.gather(*tasks)
 
     """ ADMIN COG """
 
@@ -160,9 +167,10 @@ class Admin(commands.Cog):
             await ctx.reply("This category doesn't exists", ephemeral=True)
             return
         else:
-            sub_categories = cog.sanitize_subcategories(sub_categories)
-            sub_categories.extend(cog.categories[category])
-            sub_categories = cog.sanitize_subcategories(" ".join(sub_categories))
+            sub_categories = sorted(
+                set(cog.sanitize_subcategories(sub_categories))
+                | set(cog.categories[category])
+            )
             if not sub_categories:
                 await ctx.reply("No subcategory found!", ephemeral=True)
                 return
@@ -228,12 +236,8 @@ class Admin(commands.Cog):
             if not sub_categories:
                 await ctx.reply("No subcategory found!", ephemeral=True)
                 return
-        all_subcategories = cog.categories[category]
-        final = []
-        for sb in all_subcategories:
-            if sb in sub_categories:
-                continue
-            final.append(sb)
+        to_remove = set(sub_categories)
+        final = [sb for sb in cog.categories[category] if sb not in to_remove]
 
         await self.bot.db.categories.upsert(
             {
@@ -255,7 +259,7 @@ class Admin(commands.Cog):
             await ctx.reply(f"{user.mention} is already a bot mod.")
             return
         else:
-            self.bot.mods.append(user.id)
+            self.bot.mods.add(user.id)
             await ctx.bot.db.mods.insert(
                 {
                     "_id": user.id,
@@ -273,7 +277,7 @@ class Admin(commands.Cog):
             await ctx.reply(f"{user.mention} is not a bot mod.")
             return
         else:
-            self.bot.mods.remove(user.id)
+            self.bot.mods.discard(user.id)
             await ctx.bot.db.admins.delete(
                 {
                     "_id": user.id,
@@ -316,7 +320,11 @@ class Admin(commands.Cog):
     @admin.command()
     async def banbyref(self, ctx: Context, case_id: int, reason: str = None) -> None:
         """Bot bans someone by poll reference!"""
-        found = await self.bot.db.pollings.find({"_id": case_id})
+        found = self.poll_cache.get(case_id, None)
+        if found is None:
+            found = await self.bot.db.pollings.find({"_id": case_id})
+            if found:
+                self.poll_cache.set(case_id, found, 60)
         if not found:
             await ctx.reply("No poll found with that reference!")
             return
@@ -326,6 +334,7 @@ class Admin(commands.Cog):
         added = await self.bot.blacklist.add_to_blacklist(
             found["owner"], "user", reason
         )
+        self.poll_cache.pop(case_id, None)
         await ctx.send(added)
 
     @guilds(discord.Object(id=1228685085944053882))
@@ -23,7 +23,10 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
+import copy
+import os
+import re
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Set
 
 import discord
 from discord.app_commands import describe
@@ -38,14 +41,59 @@ if TYPE_CHECKING:
     from cogs.global_actions import GlobalActions, GuildConfig
 
 
+# read-only default for channels with no quarantine overwrite; never mutated
+_EMPTY_OVERWRITE = discord.PermissionOverwrite()
+
+# config keys that need flattening before they can be written to mongo
+_WEBHOOK_KEYS = frozenset({"modlog_webhook"})
+_CHANNEL_KEYS = frozenset({"modlog_channel"})
+
+# set REGISTER_APP_COMMANDS=0 in development to skip generating slash
+# schemas for the bypass/disable trees at cog load
+_WITH_APP_COMMANDS = os.getenv("REGISTER_APP_COMMANDS", "1") != "0"
+
+
+_ROLE_MENTION = re.compile(r"<@&(\d+)>")
+_USER_MENTION = re.compile(r"<@!?(\d+)>")
+_CHANNEL_MENTION = re.compile(r"<#(\d+)>")
+_ID_ONLY = re.compile(r"\d{15,20}")
+
+# the converters keep no per-call state, so share one instance of each
+_STRICT_ROLE = StrictRole()
+_MEMBER_CONVERTER = commands.MemberConverter()
+_USER_CONVERTER = commands.UserConverter()
+
+
 class RoleMemberConverter(commands.Converter):
     async def convert(
         self, ctx: Context, argument: str
     ) -> Optional[discord.Role | discord.Member | discord.User]:
-        converters = [StrictRole, commands.MemberConverter, commands.UserConverter]
+        # dispatch on the mention shape so the typical argument runs
+        # exactly one converter instead of raising through the cascade
+        # commands pair this converter with Optional[TextChannel];
+        # reject channel mentions outright so discord.py's speculative
+        # parse doesn't raise through three converters first
+        if _CHANNEL_MENTION.fullmatch(argument):
+            raise commands.BadArgument()
+        guild = ctx.guild
+        if _ROLE_MENTION.fullmatch(argument):
+            converters = (_STRICT_ROLE,)
+        elif match := _USER_MENTION.fullmatch(argument):
+            # resolve straight from the member cache before paying for a
+            # full converter run
+            if guild and (member := guild.get_member(int(match[1]))):
+                return member
+            converters = (_MEMBER_CONVERTER, _USER_CONVERTER)
+        elif _ID_ONLY.fullmatch(argument):
+            # a bare id is most likely a user, but may still name a role
+            if guild and (member := guild.get_member(int(argument))):
+                return member
+            converters = (_MEMBER_CONVERTER, _USER_CONVERTER, _STRICT_ROLE)
+        else:
+            converters = (_STRICT_ROLE, _MEMBER_CONVERTER, _USER_CONVERTER)
         for conv in converters:
             try:
-                res = await conv().convert(ctx, argument)
+                res = await conv.convert(ctx, argument)
             except Exception:
                 res = None
                 # raise commands.BadArgument(str(e))
@@ -62,8 +110,12 @@ class Configuration(commands.Cog):
 
     def __init__(self, bot: PhantomGuard) -> None:
         self.bot = bot
-        self.registering_guilds: List[int] = self.bot.registering_guilds
+        self.registering_guilds: Set[int] = self.bot.registering_guilds
         self.webhook_avatar: Optional[bytes] = None
+        self._gas_cog: Optional[GlobalActions] = None
+        self._last_saved: Dict[int, Dict[str, Any]] = {}
+        self._avatar_task: Optional[asyncio.Task] = None
+        self._subcat_index: Dict[str, Set[str]] = {}
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -78,29 +130,68 @@ class Configuration(commands.Cog):
     async def before_leave_guilds(self) -> None:
         await self.bot.wait_until_ready()
 
-    async def leave_unauthorised_guilds(self, retry=False) -> None:
-        cog = self.bot.get_cog("GlobalActions")
-        if not cog:
-            return
-        cog: GlobalActions
-        authorised = [gc for gc in cog.guild_config.keys()]
-        if not authorised:
-            if not retry:
+    def _get_gas(self) -> Optional[GlobalActions]:
+        cog = self._gas_cog
+        if cog is None:
+            cog = self._gas_cog = self.bot.get_cog("GlobalActions")  # type: ignore
+        return cog
+
+    @commands.Cog.listener()
+    async def on_cog_load(self, cog: commands.Cog) -> None:
+        if cog.qualified_name == "GlobalActions":
+            self._gas_cog = cog  # type: ignore
+            self._subcat_index.clear()
+
+    @commands.Cog.listener()
+    async def on_cog_remove(self, cog: commands.Cog) -> None:
+        if cog.qualified_name == "GlobalActions":
+            self._gas_cog = None
+            self._subcat_index.clear()
+
+    @commands.Cog.listener()
+    async def on_ga_config_overwrite(self, guild_id: int) -> None:
+        # GlobalActions wrote this guild's config out-of-band (e.g. an
+        # OTP-OUT after a Forbidden); the skip-write snapshot no longer
+        # mirrors the database, so the next save must go through
+        self._last_saved.pop(guild_id, None)
+
+    def _valid_subcats(self, cog: GlobalActions, category: str) -> Set[str]:
+        """Set-backed view of a category's subcategories for O(1) lookups."""
+        source = cog.categories[category]
+        cached = self._subcat_index.get(category)
+        if cached is None or len(cached) != len(source):
+            cached = self._subcat_index[category] = set(source)
+        return cached
+
+    async def leave_unauthorised_guilds(self) -> None:
+        # the config cache may still be loading right after startup; wait
+        # once rather than recursing back into this method
+        for attempt in range(2):
+            if attempt:
                 await asyncio.sleep(5)
-                await self.leave_unauthorised_guilds(retry=True)
+            cog = self._get_gas()
+            if cog and cog.guild_config:
+                break
+        else:
             return
-        authorised.extend(self.registering_guilds)
-        authorised.append(1228685085944053882)
-        for guild in self.bot.guilds:
-            if guild.id not in authorised:
+        to_leave = [g for g in self.bot.guilds if not cog.is_authorised(g.id)]
+        if not to_leave:
+            return
+
+        sem = asyncio.Semaphore(3)
+
+        async def leave(guild: discord.Guild) -> None:
+            async with sem:
                 try:
                     await guild.leave()
                 except discord.HTTPException:
-                    continue
+                    pass
+
+        await asyncio.gather(*map(leave, to_leave))
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
-        cog = self.bot.get_cog("GlobalActions")
+        cog = self._get_gas()
         if not cog:
             try:
                 await guild.leave()
@@ -108,10 +199,7 @@ class Configuration(commands.Cog):
                 pass
             return
 
-        cog: GlobalActions
-        authorised = [gc for gc in cog.guild_config.keys()]
-        authorised.extend(self.registering_guilds)
-        if guild.id not in authorised:
+        if not cog.is_authorised(guild.id):
             try:
                 await guild.leave()
             except discord.HTTPException:
@@ -119,19 +207,27 @@ class Configuration(commands.Cog):
 
     async def _set_webhook_avatar_task(self) -> None:
         await self.bot.wait_until_ready()
+        # avatar bytes survive cog reloads on the bot object
+        cached = getattr(self.bot, "_webhook_avatar", None)
+        if cached is not None:
+            self.webhook_avatar = cached
+            return
         guild = self.bot.get_guild(1228685085944053882)
         if guild:
             self.webhook_avatar = await guild.icon.read()
         else:
             self.webhook_avatar = await self.bot.user.avatar.read()
+        self.bot._webhook_avatar = self.webhook_avatar
 
     async def cog_load(self) -> None:
         """Check If any invalid guilds have added the bot"""
-        asyncio.create_task(self._set_webhook_avatar_task())
+        self._avatar_task = asyncio.create_task(self._set_webhook_avatar_task())
         if not self.leave_guilds.is_running():
             self.leave_guilds.start()
 
     async def cog_unload(self) -> None:
+        if self._avatar_task and not self._avatar_task.done():
+            self._avatar_task.cancel()
         if self.leave_guilds.is_running():
             self.leave_guilds.stop()
 
@@ -156,30 +252,28 @@ class Configuration(commands.Cog):
                     "error": f"Failed to remove all permissions from {role.name}.\nIt cannot have any permissions!"
                 }
 
-        channels = guild.channels
         counter = {"success": 0, "neutral": 0, "failed": 0}
-        for channel in channels:
+        # first pass (no awaits): work out which channels actually need an edit
+        todo = []
+        for channel in guild.channels:
             if isinstance(channel, discord.CategoryChannel):
                 continue
             overwrites = channel.overwrites
-            overwrite: discord.PermissionOverwrite = overwrites.get(
-                role, discord.PermissionOverwrite()
-            )
+            overwrite: discord.PermissionOverwrite = overwrites.get(role)
+            if overwrite is None:
+                overwrite = _EMPTY_OVERWRITE
             changes_needed = False
             if isinstance(channel, discord.TextChannel):
-                if any(
-                    [
-                        overw is True or overw is None
-                        for overw in (
-                            overwrite.view_channel,
-                            overwrite.send_messages,
-                            overwrite.create_private_threads,
-                            overwrite.create_private_threads,
-                            overwrite.send_messages_in_threads,
-                            overwrite.create_instant_invite,
-                        )
-                    ]
+                if (
+                    overwrite.view_channel is not False
+                    or overwrite.send_messages is not False
+                    or overwrite.create_public_threads is not False
+                    or overwrite.create_private_threads is not False
+                    or overwrite.send_messages_in_threads is not False
+                    or overwrite.create_instant_invite is not False
                 ):
+                    if overwrite is _EMPTY_OVERWRITE:
+                        overwrite = discord.PermissionOverwrite()
                     overwrite.view_channel = False
                     overwrite.send_messages = False
                     overwrite.create_public_threads = False
@@ -189,38 +283,50 @@ class Configuration(commands.Cog):
                     overwrites[role] = overwrite
                     changes_needed = True
             else:
-                if any(
-                    [
-                        overw is True or overw is None
-                        for overw in (
-                            overwrite.view_channel,
-                            overwrite.send_messages,
-                            overwrite.create_instant_invite,
-                        )
-                    ]
+                if (
+                    overwrite.view_channel is not False
+                    or overwrite.send_messages is not False
+                    or overwrite.create_instant_invite is not False
                 ):
+                    if overwrite is _EMPTY_OVERWRITE:
+                        overwrite = discord.PermissionOverwrite()
                     overwrite.view_channel = False
                     overwrite.send_messages = False
                     overwrite.create_instant_invite = False
                     overwrites[role] = overwrite
                     changes_needed = True
             if changes_needed:
+                todo.append((channel, overwrites))
+            else:
+                counter["neutral"] += 1
+
+        if not todo:
+            return counter
+
+        # second pass: run the edits concurrently, bounded so we don't
+        # hammer the per-route rate limit on large guilds
+        sem = asyncio.Semaphore(5)
+
+        async def edit_one(channel, overwrites) -> str:
+            async with sem:
                 try:
                     await channel.edit(
                         overwrites=overwrites,
                         reason="Sanitising Channel's Quarantine Override",
                     )
                 except discord.Forbidden:
-                    return {
-                        "error": "I am missing permissions to edit the channel's overwrites"
-                    }
+                    return "forbidden"
                 except discord.HTTPException:
-                    counter["failed"] += 1
-                    continue
-                else:
-                    counter["success"] += 1
-            else:
-                counter["neutral"] += 1
+                    return "failed"
+                return "success"
+
+        results = await asyncio.gather(*(edit_one(c, o) for c, o in todo))
+        if "forbidden" in results:
+            return {
+                "error": "I am missing permissions to edit the channel's overwrites"
+            }
+        for result in results:
+            counter[result] += 1
 
         return counter
 
@@ -238,7 +344,7 @@ class Configuration(commands.Cog):
         await ctx.send_help("config")
 
     async def get_gas_cog(self, ctx: Context) -> Optional[GlobalActions]:
-        cog: GlobalActions = self.bot.get_cog("GlobalActions")  # type: ignore
+        cog = self._get_gas()
         if not cog:
             await ctx.reply(
                 "This command is unavailable right now, try again later.",
@@ -264,22 +370,23 @@ class Configuration(commands.Cog):
     async def save_config(self, ctx: Context, config: GuildConfig) -> None:
         cog = await self.get_gas_cog(ctx)
         if not cog:
-            await ctx.reply(
-                "This feature is unavailable right now, try again later.",
-                ephemeral=True,
-            )
+            # get_gas_cog has already told the invoker
             return None
         cog.set_config(ctx.guild.id, config)
         friendly = {}
         for key, value in config.items():
-            if key == "modlog_webhook":
+            if key in _WEBHOOK_KEYS:
                 if value:
                     friendly[key] = value.url
-            elif key == "modlog_channel":
+            elif key in _CHANNEL_KEYS:
                 if value:
                     friendly[key] = value.id
             else:
                 friendly[key] = value
+        if friendly == self._last_saved.get(ctx.guild.id):
+            return None
+        # deep copy so in-place category edits can't alias the snapshot
+        self._last_saved[ctx.guild.id] = copy.deepcopy(friendly)
         await self.bot.db.global_actions.upsert({"_id": ctx.guild.id}, friendly)
 
     @custom_check(administrator=True)
@@ -307,11 +414,12 @@ class Configuration(commands.Cog):
         if not report:
             await ctx.reply("Invalid Case ID!")
             return
-        action_type = None
-        for sanction in report["sanctions"]:
-            if user.id in sanction["users"]:
-                action_type = sanction["action"]
-                break
+        sanctions_by_user = {
+            uid: sanction["action"]
+            for sanction in report["sanctions"]
+            for uid in sanction["users"]
+        }
+        action_type = sanctions_by_user.get(user.id)
         if not action_type:
             await ctx.reply("Could not find a action_type for user!")
             return
@@ -432,9 +540,23 @@ class Configuration(commands.Cog):
             )
             return
 
-        # try to use the webhook (maybe wick or someone else deletes it)
-        await asyncio.sleep(2)  # sleep to ensure it is safe to use
-        # that is if wick was to delete it, it would be done by now
+        # verify the webhook still exists (maybe wick or someone else
+        # deletes it) - only back off and recheck when it looks deleted,
+        # instead of always sleeping two seconds
+        try:
+            await modlog_webhook.fetch()
+        except discord.NotFound:
+            await asyncio.sleep(2)
+            try:
+                await modlog_webhook.fetch()
+            except (discord.NotFound, discord.HTTPException):
+                await ctx.reply(
+                    "Webhook creation failed! (Make sure no other bot is deleting my webhook).",
+                    ephemeral=True,
+                )
+                return
+        except discord.HTTPException:
+            pass
         try:
             await modlog_webhook.send(
                 content="Testing Webhook!",
@@ -454,23 +576,15 @@ class Configuration(commands.Cog):
             f"{modlog.mention} has been set as your modlog channel", ephemeral=True
         )
 
-    @custom_check(administrator=True)
-    @commands.bot_has_permissions(send_messages=True, embed_links=True)
-    @describe(
-        category="The main category you wish to follow.",
-        sub_categories="Type all to follow all sub categories. Split categories via space: i.e sub_cat1 sub_cat2",
-    )
-    @commands.cooldown(1, 3, commands.BucketType.user)
-    @_config.command(name="follow_category")
-    async def follow_category(
-        self, ctx: Context, category: str, sub_categories: str
+    async def _set_category_flags(
+        self, ctx: Context, category: str, sub_categories: str, *, enable: bool
     ) -> None:
+        """Shared body of follow_category / unfollow_category."""
         cog = await self.get_gas_cog(ctx)
         if not cog:
             return
-        cog: GlobalActions
 
-        if category not in cog.categories.keys():
+        if category not in cog.categories:
             await ctx.reply(f'"{category}" does not exist', ephemeral=True)
             return
         if sub_categories == "all":
@@ -487,24 +601,35 @@ class Configuration(commands.Cog):
                 ephemeral=True,
             )
             return
-        else:
-            config = await self.get_config_for(ctx)
-            if not config:
+        config = await self.get_config_for(ctx)
+        if not config:
+            return
+        valid_subcategories = self._valid_subcats(cog, category)
+        for sb in sub_categories:
+            if sb in valid_subcategories:
+                config["categories"][category][sb] = enable
+            else:
+                await ctx.reply(f'subcategory "{sb}" does not exist', ephemeral=True)
                 return
-            valid_subcategories = cog.categories[category]
-            for sb in sub_categories:
-                if sb in valid_subcategories:
-                    config["categories"][category][sb] = True
-                else:
-                    await ctx.reply(
-                        f'subcategory "{sb}" does not exist', ephemeral=True
-                    )
-                    return
 
-            await self.save_config(ctx, config)
-            await ctx.reply(
-                f"You are now following the sub categories: {ctx.humanize_list(sub_categories)}"
-            )
+        await self.save_config(ctx, config)
+        verb = "following" if enable else "unfollowing"
+        await ctx.reply(
+            f"You are now {verb} the sub categories: {ctx.humanize_list(sub_categories)}"
+        )
+
+    @custom_check(administrator=True)
+    @commands.bot_has_permissions(send_messages=True, embed_links=True)
+    @describe(
+        category="The main category you wish to follow.",
+        sub_categories="Type all to follow all sub categories. Split categories via space: i.e sub_cat1 sub_cat2",
+    )
+    @commands.cooldown(1, 3, commands.BucketType.user)
+    @_config.command(name="follow_category")
+    async def follow_category(
+        self, ctx: Context, category: str, sub_categories: str
+    ) -> None:
+        await self._set_category_flags(ctx, category, sub_categories, enable=True)
 
     @custom_check(administrator=True)
     @commands.bot_has_permissions(send_messages=True, embed_links=True)
@@ -517,45 +642,7 @@ class Configuration(commands.Cog):
     async def unfollow_category(
         self, ctx: Context, category: str, sub_categories: str
     ) -> None:
-        cog: GlobalActions = await self.get_gas_cog(ctx)
-        if not cog:
-            return
-        cog: GlobalActions
-        if category not in cog.categories.keys():
-            await ctx.reply(f'"{category}" does not exist', ephemeral=True)
-            return
-        if sub_categories == "all":
-            sub_categories = cog.categories[category]
-        else:
-            sub_categories = cog.sanitize_subcategories(sub_categories)
-
-        if not sub_categories:
-            await ctx.reply(
-                (
-                    f"No valid subcategory found!\nThe category {category}"
-                    f" has the following sub categories: {ctx.humanize_list(cog.categories[category])}"
-                ),
-                ephemeral=True,
-            )
-            return
-        else:
-            config = await self.get_config_for(ctx)
-            if not config:
-                return
-            valid_subcategories = cog.categories[category]
-            for sb in sub_categories:
-                if sb in valid_subcategories:
-                    config["categories"][category][sb] = False
-                else:
-                    await ctx.reply(
-                        f'subcategory "{sb}" does not exist', ephemeral=True
-                    )
-                    return
-
-            await self.save_config(ctx, config)
-            await ctx.reply(
-                f"You are now unfollowing the sub categories: {ctx.humanize_list(sub_categories)}"
-            )
+        await self._set_category_flags(ctx, category, sub_categories, enable=False)
 
     @custom_check(administrator=True)
     @commands.bot_has_permissions(
@@ -601,6 +688,7 @@ class Configuration(commands.Cog):
                 "You need to setup a quarantine role first...", ephemeral=True
             )
             return
+        old_role_id = role
         role = ctx.guild.get_role(role)
         if not role:
             await ctx.reply(
@@ -611,8 +699,9 @@ class Configuration(commands.Cog):
         if result.get("error"):
             await ctx.reply(result["error"], ephemeral=True)
             return
-        config["quarantine_role"] = role.id
-        await self.save_config(ctx, config)
+        if result["success"] > 0 or old_role_id != role.id:
+            config["quarantine_role"] = role.id
+            await self.save_config(ctx, config)
         await ctx.reply(
             f"Fixed quarantine role in {result['success']:,} channels.\n"
             f"{result['neutral']:,} channels didn't need a modification\n"
@@ -655,6 +744,19 @@ class Configuration(commands.Cog):
         for key, value in config.items():
             if key == "modlog_webhook":
                 continue
+            elif key == "categories":
+                lines = []
+                for category, subcategories in value.items():
+                    following_subcategories = [
+                        f"`{sb}`" for sb, enabled in subcategories.items() if enabled
+                    ]
+                    if following_subcategories:
+                        lines.append(
+                            f"**{category.capitalize()}**: {ctx.humanize_list(following_subcategories)}"
+                        )
+                if lines:
+                    categories_field = "\n".join(lines)
+                continue
             elif key == "modlog_channel":
                 if value:
                     value = value.mention
@@ -662,21 +764,7 @@ class Configuration(commands.Cog):
                 value = ctx.guild.get_role(value)
                 if value:
                     value = value.mention
-            if key == "categories":
-                value = []
-                for category, subcategories in config["categories"].items():
-                    following_subcategories = []
-                    for sb in subcategories:
-                        if subcategories[sb]:
-                            following_subcategories.append(f"`{sb}`")
-                    if following_subcategories:
-                        value.append(
-                            f"**{category.capitalize()}**: {ctx.humanize_list(following_subcategories)}"
-                        )
-                if value:
-                    categories_field = "\n".join(value)
-            else:
-                description.append(f"**{key.lower().capitalize()}**: {value}")
+            description.append(f"**{key.lower().capitalize()}**: {value}")
 
         embed = discord.Embed(
             title="Configuration", description="\n".join(description), colour=0x2F3136
@@ -720,7 +808,7 @@ class Configuration(commands.Cog):
         name="bypass",
         case_insensitive=True,
         invoke_without_command=True,
-        with_app_command=True,
+        with_app_command=_WITH_APP_COMMANDS,
     )
     async def _bypass(self, ctx: Context) -> None:
         """Add, Remove, View bypassed commands."""
@@ -779,7 +867,7 @@ class Configuration(commands.Cog):
         name="disable",
         case_insensitive=True,
         invoke_without_command=True,
-        with_app_command=True,
+        with_app_command=_WITH_APP_COMMANDS,
     )
     async def _disable(self, ctx: Context) -> None:
         """Add, Remove, View disabled commands."""
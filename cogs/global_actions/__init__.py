@@ -23,22 +23,45 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
-from .enums import MaxDuration  # noqa: F401
-from .global_actions import (
-    Actions,
-    AppealActions,
-    GlobalActions,
-    GuildConfig,
-    ScopeTypes,
-)
-
 if TYPE_CHECKING:
     from bot import PhantomGuard
 
+    from .enums import MAX_DURATION  # noqa: F401
+    from .global_actions import (  # noqa: F401
+        Actions,
+        AppealActions,
+        GlobalActions,
+        GuildConfig,
+        ScopeTypes,
+    )
+
 __all__ = ["GlobalActions", "GuildConfig", "ScopeTypes", "Actions", "AppealActions"]
 
+# names that can be served from the lightweight enums module without
+# pulling in the cog (and with it discord.py's full machinery)
+_ENUM_ATTRS = frozenset({"Actions", "AppealActions", "ScopeTypes", "MAX_DURATION"})
+
+
+def __getattr__(name: str):
+    # PEP 562: resolve the heavy imports on first actual use
+    if name in _ENUM_ATTRS:
+        from . import enums
+
+        return getattr(enums, name)
+    if name in __all__:
+        from . import global_actions
+
+        return getattr(global_actions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 async def setup(bot: PhantomGuard):
-    await bot.add_cog(GlobalActions(bot))
+    from .global_actions import GlobalActions
+
+    cog = GlobalActions(bot)
+    await bot.add_cog(cog)
+    # warm the caches concurrently with the remaining extensions
+    cog._init_task = asyncio.create_task(cog.async_init())
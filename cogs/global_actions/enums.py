@@ -21,7 +21,10 @@
 # SOFTWARE.
 
 
+import sys
 from enum import IntEnum
+from types import MappingProxyType
+from typing import Final, Mapping
 
 
 class Actions(IntEnum):
@@ -33,37 +36,21 @@ class Actions(IntEnum):
     BAN: int = 5
 
     def __str__(self) -> str:
-        if self.value == 0:
-            return "none"
-        elif self.value == 1:
-            return "warn"
-        elif self.value == 2:
-            return "mute"
-        elif self.value == 3:
-            return "quarantine"
-        elif self.value == 4:
-            return "kick"
-        elif self.value == 5:
-            return "ban"
+        return self._str
 
     def validate(self, value: str) -> bool:
         return str(self) == value
 
     @staticmethod
-    def from_str(value: str) -> "Actions":
-        value = value.lower()
-        if value == "none":
-            return Actions.NONE
-        elif value == "warn":
-            return Actions.WARN
-        elif value == "mute":
-            return Actions.MUTE
-        elif value == "quarantine":
-            return Actions.QUARANTINE
-        elif value == "kick":
-            return Actions.KICK
-        elif value == "ban":
-            return Actions.BAN
+    def from_str(value: "str | Actions") -> "Actions":
+        if isinstance(value, Actions):
+            return value
+        # converters usually hand us lowercase input already; only pay
+        # for str.lower() when the direct probe misses
+        hit = _ACTION_FROM_STR.get(value)
+        if hit is not None:
+            return hit
+        return _ACTION_FROM_STR.get(value.lower())
 
 
 class AppealActions(IntEnum):
@@ -72,36 +59,22 @@ class AppealActions(IntEnum):
     UNBAN: int = 3
 
     def __str__(self) -> str:
-        if self.value == 1:
-            return "unmute"
-        elif self.value == 2:
-            return "unquarantine"
-        elif self.value == 3:
-            return "unban"
+        return self._str
 
 
-class MaxDuration(IntEnum):
-    NONE: int = 0
-    WARN: int = 0
-    MUTE: int = 28
-    QUARANTINE: int = 365
-    KICK: int = 0
-    BAN: int = 365
-
-    def from_str(value: str) -> "MaxDuration":
-        value = value.lower()
-        if value == "none":
-            return MaxDuration.NONE
-        elif value == "warn":
-            return MaxDuration.WARN
-        elif value == "mute":
-            return MaxDuration.MUTE
-        elif value == "quarantine":
-            return MaxDuration.QUARANTINE
-        elif value == "kick":
-            return MaxDuration.KICK
-        elif value == "ban":
-            return MaxDuration.BAN
+# maximum sanction duration in days, keyed by action name. This used to
+# be an IntEnum, but NONE/WARN/KICK all being 0 made them aliases of one
+# member and from_str("kick") silently answered NONE.
+MAX_DURATION: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "none": 0,
+        "warn": 0,
+        "mute": 28,
+        "quarantine": 365,
+        "kick": 0,
+        "ban": 365,
+    }
+)
 
 
 class ScopeTypes(IntEnum):
@@ -110,19 +83,31 @@ class ScopeTypes(IntEnum):
     GLOBAL: int = 2
 
     def __str__(self) -> str:
-        if self.value == 0:
-            return "targeted"
-        elif self.value == 1:
-            return "mutual"
-        elif self.value == 2:
-            return "global"
+        return self._str
 
     @staticmethod
-    def from_str(value: str) -> "ScopeTypes":
-        value = value.lower()
-        if value == "targeted":
-            return ScopeTypes.TARGETED
-        elif value == "mutual":
-            return ScopeTypes.MUTUAL
-        elif value == "global":
-            return ScopeTypes.GLOBAL
+    def from_str(value: "str | ScopeTypes") -> "ScopeTypes":
+        if isinstance(value, ScopeTypes):
+            return value
+        hit = _SCOPE_FROM_STR.get(value)
+        if hit is not None:
+            return hit
+        return _SCOPE_FROM_STR.get(value.lower())
+
+
+# bind the string form onto each member once at import; __str__ becomes a
+# plain attribute load. Deriving from member.name (interned so dict/set
+# probes short-circuit on identity) means a newly added member can never
+# drift out of sync with its string form
+for _member in (*Actions, *AppealActions, *ScopeTypes):
+    _member._str = sys.intern(_member.name.lower())
+del _member
+
+# dense value -> member tables; indexing these skips Enum.__call__'s
+# _value2member_map_ machinery when rehydrating stored ints
+ACTIONS_BY_VALUE = tuple(Actions)
+SCOPES_BY_VALUE = tuple(ScopeTypes)
+
+# parse tables - one hashed lookup instead of chained string comparisons
+_ACTION_FROM_STR = {str(member): member for member in Actions}
+_SCOPE_FROM_STR = {str(member): member for member in ScopeTypes}
@@ -25,16 +25,28 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import itertools
 import logging
-import uuid
-from typing import TYPE_CHECKING, Dict, List, Never, Optional, TypedDict
+import time
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Never,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+)
 
 import discord
 from discord.ext import commands
 
 from utils.time import human_timedelta
 
-from .enums import Actions, AppealActions, ScopeTypes
+from .enums import ACTIONS_BY_VALUE, Actions, AppealActions, ScopeTypes
 
 if TYPE_CHECKING:
     from bot import PhantomGuard
@@ -43,14 +55,14 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-def generate_snowflake() -> str:
-    """Generates a unique Snowflake ID"""
-    timestamp = datetime.datetime.now().timestamp()
-    unique_id = uuid.uuid4()
-    timestamp_int = int(timestamp * 1000)
-    snowflake = f"{timestamp_int}-{unique_id}"
+_snowflake_counter = itertools.count()
+
 
-    return snowflake
+def generate_snowflake() -> int:
+    """Generates a unique Snowflake ID"""
+    # millisecond timestamp in the high bits, a wrapping 22-bit sequence in
+    # the low bits - the usual snowflake layout, minus the worker id
+    return (time.time_ns() // 1_000_000) << 22 | (next(_snowflake_counter) & 0x3FFFFF)
 
 
 class GuildConfig(TypedDict):
@@ -61,23 +73,75 @@ class GuildConfig(TypedDict):
     modlog_channel: Optional[discord.TextChannel]
 
 
-class SanctionData(TypedDict):
+@dataclass(slots=True)
+class SanctionEntry:
+    _id: Any
     target: int
     category: str
     subcategory: str
     actiontype: int
     created: datetime.datetime
-    expires: datetime.datetime
+    expires: Optional[datetime.datetime]
     case_id: int
 
 
 class FakeUser:
+    __slots__ = ("id", "mention")
+
     def __init__(self, _id, mention):
         self.id: int = _id
         self.mention: str = mention
 
 
+_SUCCESS_FMT = "**Success**"
+_FAILURE_FMT = (
+    "**Failed**\n"
+    "As a result this server **may** have been marked OTP OUT of global actions\n"
+    "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
+)
+
+_GREEN = discord.Colour.green()
+_NO_MENTIONS = discord.AllowedMentions.none()
+
+# shared .get() default; never mutated
+_EMPTY: Dict[str, bool] = {}
+
+# action types whose sanctions are persisted even without an expiry
+_PERSIST_TYPES = frozenset({Actions.BAN, Actions.KICK, Actions.QUARANTINE})
+
+# DM notice templates keyed by Actions value; anything unmapped (an actual
+# sanction) falls back to _DESC_ACTIONED
+_DESC_ACTIONED = (
+    "Your account was reported in case number {case_id} to DDA!\n"
+    "The following actions were performed on your account: **{actiontype}** in {success:,} Servers\n"
+    "{duration}"
+    "[Appeal Here](https://discord.gg/vZVq7WX9SD)\n"
+    "**Note**: We are not discord, but a organisation on its platform that represents over {total:,} servers "
+)
+_DESC_TEMPLATES: Dict[int, str] = {
+    Actions.NONE.value: (
+        "Your account was reported in case number {case_id} to DDA!\n"
+        "We found you to not be involved / deserving of any actions as a consequence of this case!\n"
+        "**Note**: We are not discord, but a organisation on its platform that represents over {total:,} servers "
+    ),
+    Actions.WARN.value: (
+        "Your account was reported in case number {case_id} to DDA!\n"
+        "We have decided to **warn** you to not break our terms in servers that are represented by us!\n"
+        "**Note**: We are not discord, but a organisation on its platform that represents over {total:,} servers "
+    ),
+}
+
+# the subset of a stored global_actions document that belongs in guild_config
+_CFG_KEYS = frozenset(
+    {"quarantine_role", "otp_in", "categories", "modlog_channel", "modlog_webhook"}
+)
+
 HARMFUL_PERMISSIONS = discord.Permissions(1100317073470)
+# raw bitmask of the above; mask role.permissions.value against this rather
+# than paying for a Permissions.__and__ object per role
+_HARMFUL_MASK: int = HARMFUL_PERMISSIONS.value
+
+OWNER_GUILD_ID = 1228685085944053882
 
 
 # HARMFUL_PERMISSIONS.administrator = True
@@ -97,10 +161,25 @@ class GlobalActions(commands.Cog):
         self.bot: PhantomGuard = bot
         self.categories: Dict[str, List[str]] = {}
         self.guild_config: Dict[int, GuildConfig] = {}
-        self.sanction_cache: Dict[int, Dict[str, SanctionData]] = {}
+        # flat (guild_id, target_id) keying makes the join-event probe O(1)
+        # instead of a scan over every sanction in the guild
+        self.sanction_cache: Dict[Tuple[int, int], List[SanctionEntry]] = {}
+        # secondary index: (guild, target, actiontype, case_id) -> entry,
+        # so timer completions delete without scanning the cache
+        self.sanction_by_key: Dict[Tuple[int, int, int, int], SanctionEntry] = {}
+        self.harmful_role_ids: Dict[int, Set[int]] = {}
         self.webhook_avatar: Optional[bytes] = None
-        self.webhook_creation_lock: Dict[int, asyncio.Event] = {}
+        self.webhook_creation_lock: Dict[int, asyncio.Lock] = {}
         self.stats_channel: Optional[discord.TextChannel] = None
+        self._init_task: Optional[asyncio.Task] = None
+        # O(1) dispatch for guild_sanction; NONE/WARN return early and
+        # anything unmapped is a no-op success
+        self._action_handlers = {
+            Actions.BAN: self._do_ban,
+            Actions.KICK: self._do_kick,
+            Actions.QUARANTINE: self._do_quarantine,
+            Actions.MUTE: self._do_mute,
+        }
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -108,28 +187,47 @@ class GlobalActions(commands.Cog):
 
     @staticmethod
     def sanitize_subcategories(subcategories: str) -> List[str]:
-        subcategories = subcategories.strip().split(" ")
-        subcategories = set(subcategories)
-        new = []
-        for sub in subcategories:
-            if not sub:
-                continue
-            new.append(sub)
-        return new
+        # bare str.split() collapses whitespace runs and drops empty tokens,
+        # so the strip/filter passes are unnecessary
+        return list(set(subcategories.split()))
+
+    async def _wait_until_guild_available(
+        self, guild_id: int, timeout: float = 10.0
+    ) -> Optional[discord.Guild]:
+        """Waits for a guild to appear in the cache.
+
+        wait_until_ready can resolve before the guild cache is fully
+        populated, so poll briefly instead of trusting a single get_guild.
+        """
+        deadline = time.monotonic() + timeout
+        while (guild := self.bot.get_guild(guild_id)) is None:
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(0.1)
+        return guild
 
     async def _set_webhook_avatar_task(self):
         await self.bot.wait_until_ready()
-        guild = self.bot.get_guild(1228685085944053882)
+        guild = await self._wait_until_guild_available(OWNER_GUILD_ID)
         if guild:
             self.webhook_avatar = await guild.icon.read()
         else:
             self.webhook_avatar = await self.bot.user.avatar.read()
 
     async def _build_cache(self):
+        category_data = await self.bot.db.categories.get_all()
+        for category in category_data:
+            self.categories[category["_id"]] = category["categories"]
         await self.bot.wait_until_ready()
         self.stats_channel = self.bot.get_channel(1241062053368692866)
-        guild_config = await self.bot.db.global_actions.get_all()
-        for config in guild_config:
+        for guild in self.bot.guilds:
+            self.harmful_role_ids[guild.id] = {
+                role.id
+                for role in guild.roles
+                if role.permissions.value & _HARMFUL_MASK
+            }
+
+        async def _process_config(config) -> None:
             if config["modlog_channel"]:
                 config["modlog_channel"] = self.bot.get_channel(
                     config["modlog_channel"]
@@ -150,48 +248,56 @@ class GlobalActions(commands.Cog):
                             "modlog_webhook": None,
                         },
                     )
-            data = {}
-            for key, value in config.items():
-                if key not in [
-                    "quarantine_role",
-                    "otp_in",
-                    "categories",
-                    "modlog_channel",
-                    "modlog_webhook",
-                ]:
-                    continue
-                data[key] = value
-            self.guild_config[config["_id"]] = data
+            self.guild_config[config["_id"]] = {
+                key: config[key] for key in _CFG_KEYS if key in config
+            }
+
+        guild_config = await self.bot.db.global_actions.get_all()
+        # the upsert on the bad-webhook path is the only await per config;
+        # overlap them instead of serialising startup on each round-trip
+        await asyncio.gather(*map(_process_config, guild_config))
 
         sanction_data = await self.bot.db.sanctions.get_all()
         for sanction in sanction_data:
-            data = {}
             expires = sanction["expires"]
             if expires:
                 expires = expires.replace(tzinfo=datetime.timezone.utc)
 
-            data.update(
-                {
-                    "target": sanction["target"],
-                    "actiontype": sanction["actiontype"],
-                    "created": sanction["created"],
-                    "expires": expires,
-                    "case_id": sanction["case_id"],
-                    "category": sanction["category"],
-                    "subcategory": sanction["subcategory"],
-                }
+            data = SanctionEntry(
+                _id=sanction["_id"],
+                target=sanction["target"],
+                actiontype=sanction["actiontype"],
+                created=sanction["created"],
+                expires=expires,
+                case_id=sanction["case_id"],
+                category=sanction["category"],
+                subcategory=sanction["subcategory"],
             )
-            if sanction["guild"] not in self.sanction_cache.keys():
-                self.sanction_cache[sanction["guild"]] = {}
-            self.sanction_cache[sanction["guild"]][sanction["_id"]] = data
+            self.sanction_cache.setdefault(
+                (sanction["guild"], sanction["target"]), []
+            ).append(data)
+            self.sanction_by_key[
+                (
+                    sanction["guild"],
+                    sanction["target"],
+                    data.actiontype,
+                    data.case_id,
+                )
+            ] = data
+
+    async def async_init(self) -> None:
+        """Background warm-up, launched from setup() so extension loading
+        never blocks on the database."""
+        await asyncio.gather(self._set_webhook_avatar_task(), self._build_cache())
 
     async def cog_load(self) -> None:
-        # load from db categories, and guild_config
-        asyncio.create_task(self._set_webhook_avatar_task())
-        asyncio.create_task(self._build_cache())
-        category_data = await self.bot.db.categories.get_all()
-        for category in category_data:
-            self.categories[category["_id"]] = category["categories"]
+        # let other cogs refresh any cached reference to this cog
+        self.bot.dispatch("cog_load", self)
+
+    async def cog_unload(self) -> None:
+        if self._init_task and not self._init_task.done():
+            self._init_task.cancel()
+        self.bot.dispatch("cog_remove", self)
 
     def add_config(
         self,
@@ -211,15 +317,37 @@ class GlobalActions(commands.Cog):
     def set_config(self, guild_id: int, config: GuildConfig):
         self.guild_config[guild_id] = config
 
+    def is_authorised(self, guild_id: int) -> bool:
+        """Whether the bot is allowed to stay in this guild."""
+        return (
+            guild_id in self.guild_config
+            or guild_id in self.bot.registering_guilds
+            or guild_id == OWNER_GUILD_ID
+        )
+
     def pred_otp(self, guild: int) -> bool:
         if guild not in self.guild_config:
             return False
         return self.guild_config[guild]["otp_in"]
 
     def pred_category(self, guild: int, main: str, sub: str) -> bool:
-        if guild not in self.guild_config:
+        # subscribed guilds are the common case; let the miss pay for the
+        # exception instead of chaining .get() defaults on every hit
+        try:
+            return self.guild_config[guild]["categories"][main][sub]
+        except KeyError:
             return False
-        return self.guild_config[guild]["categories"].get(main, {}).get(sub, False)
+
+    async def _disable_otp(self, guild_id: int, **fields) -> None:
+        """Marks a guild OTP-OUT in the cache and database in one place."""
+        cfg = self.guild_config[guild_id]
+        cfg["otp_in"] = False
+        cfg.update(fields)
+        await self.bot.db.global_actions.upsert(
+            {"_id": guild_id}, {"_id": guild_id, "otp_in": False, **fields}
+        )
+        # tell the Configuration cog its skip-write snapshot is stale
+        self.bot.dispatch("ga_config_overwrite", guild_id)
 
     async def on_strip(
         self,
@@ -228,24 +356,20 @@ class GlobalActions(commands.Cog):
         case_id: int,
         expires: datetime.datetime,
         success: bool,
+        humanized: Optional[str] = None,
     ):
         """called when a person's roles are stripped"""
-        success_fmt = (
-            "**Success**"
-            if success
-            else (
-                "**Failed**\n"
-                "As a result this server **may** have been marked OTP OUT of global actions\n"
-                "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
-            )
-        )
+        success_fmt = _SUCCESS_FMT if success else _FAILURE_FMT
+
+        if expires is not None and humanized is None:
+            humanized = human_timedelta(expires, suffix=False, accuracy=4)
 
         content = f"DDA Report Compliance: {success_fmt}"
         description = (
             f"**Offender**: {target.mention}\n"
             + (
                 (
-                    f"**Duration**: {human_timedelta(expires, suffix=False, accuracy=4)}"
+                    f"**Duration**: {humanized}"
                     f" [ {discord.utils.format_dt(expires, 'f')}]\n"
                 )
                 if expires is not None
@@ -257,7 +381,7 @@ class GlobalActions(commands.Cog):
 
         embed = discord.Embed(
             title="**Role(s) Stripped**",
-            colour=discord.Colour.green() if success else 0xFF0010,
+            colour=_GREEN if success else 0xFF0010,
             description=description,
         )
         embed.timestamp = discord.utils.utcnow()
@@ -267,15 +391,7 @@ class GlobalActions(commands.Cog):
         self, guild: discord.Guild, target: discord.Member, case_id: int, success: bool
     ):
         """called when a person's roles are restored"""
-        success_fmt = (
-            "**Success**"
-            if success
-            else (
-                "**Failed**\n"
-                "As a result this server **may** have been marked OTP OUT of global actions\n"
-                "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
-            )
-        )
+        success_fmt = _SUCCESS_FMT if success else _FAILURE_FMT
 
         content = f"DDA Restoration Compliance: {success_fmt}"
         description = (
@@ -286,7 +402,7 @@ class GlobalActions(commands.Cog):
 
         embed = discord.Embed(
             title="**Role(s) Restored**",
-            colour=discord.Colour.green() if success else 0xFF0010,
+            colour=_GREEN if success else 0xFF0010,
             description=description,
         )
         embed.timestamp = discord.utils.utcnow()
@@ -302,23 +418,20 @@ class GlobalActions(commands.Cog):
         subcategory: str,
         success: bool,
         expires: Optional[datetime.datetime] = None,
+        humanized: Optional[str] = None,
     ) -> bool:
         """Helper function for sending modlogs when a sanction is completed"""
-        success_fmt = (
-            "**Success**"
-            if success
-            else (
-                "**Failed**\n"
-                "As a result this server **may** have been marked OTP OUT of global actions\n"
-                "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
-            )
-        )
+        success_fmt = _SUCCESS_FMT if success else _FAILURE_FMT
+
+        if expires is not None and humanized is None:
+            humanized = human_timedelta(expires, suffix=False, accuracy=4)
+
         content = f"Discord Defence Association Report: {success_fmt}"
         description = (
             f"**Offender**: {target.mention}\n"
             + (
                 (
-                    f"**Duration**: {human_timedelta(expires, suffix=False, accuracy=4)}"
+                    f"**Duration**: {humanized}"
                     f" [ {discord.utils.format_dt(expires, 'f')}]\n"
                 )
                 if expires is not None
@@ -330,7 +443,7 @@ class GlobalActions(commands.Cog):
         )
         embed = discord.Embed(
             title=f"**{str(actiontype).capitalize()}**",
-            colour=discord.Colour.green() if success else 0xFF0010,
+            colour=_GREEN if success else 0xFF0010,
             description=description,
         )
         embed.timestamp = discord.utils.utcnow()
@@ -349,26 +462,18 @@ class GlobalActions(commands.Cog):
         if isinstance(target, discord.Object):
             target = FakeUser(target.id, f"<@{target.id}>")
 
-        success_fmt = (
-            "**Success**"
-            if success
-            else (
-                "**Failed**\n"
-                "As a result this server **may** have been marked OTP OUT of global actions\n"
-                "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
-            )
-        )
+        success_fmt = _SUCCESS_FMT if success else _FAILURE_FMT
         content = f"DDA Restoration Compliance: {success_fmt}"
         description = (
             f"**Offender**: {target.mention}\n"
-            f"**Action Type**: {str(Actions(actiontype)).capitalize()}\n"
+            f"**Action Type**: {str(ACTIONS_BY_VALUE[actiontype]).capitalize()}\n"
             f"**Case ID**: {case_id}\n"
             f"Use `/report view {case_id}` to view this case."
         )
 
         embed = discord.Embed(
-            title=f"Action Expiry: **{str(Actions(actiontype)).capitalize()}**",
-            colour=discord.Colour.green() if success else 0xFF0010,
+            title=f"Action Expiry: **{str(ACTIONS_BY_VALUE[actiontype]).capitalize()}**",
+            colour=_GREEN if success else 0xFF0010,
             description=description,
         )
         embed.timestamp = discord.utils.utcnow()
@@ -386,15 +491,7 @@ class GlobalActions(commands.Cog):
     ) -> bool:
         """called when an appeal is accepted."""
 
-        success_fmt = (
-            "**Success**"
-            if success
-            else (
-                "**Failed**\n"
-                "As a result this server **may** have been marked OTP OUT of global actions\n"
-                "Check using `/config show` and to __re-setup__ use `/config modlog [channel]` & `/config otp-in True`"
-            )
-        )
+        success_fmt = _SUCCESS_FMT if success else _FAILURE_FMT
         content = f"DDA Appeal Compliance: {success_fmt}"
         description = (
             f"**Offender**: {target.mention}\n"
@@ -406,7 +503,7 @@ class GlobalActions(commands.Cog):
 
         embed = discord.Embed(
             title=f"**{str(appealtype).capitalize()}**",
-            colour=discord.Colour.green() if success else 0xFF0010,
+            colour=_GREEN if success else 0xFF0010,
             description=description,
         )
         embed.timestamp = discord.utils.utcnow()
@@ -416,21 +513,21 @@ class GlobalActions(commands.Cog):
         self, guild: discord.Guild, target: discord.Member, case_id: int
     ) -> bool:
         if not guild.me.guild_permissions.manage_roles:
-            self.guild_config[guild.id]["otp_in"] = False
-            await self.bot.db.global_actions.upsert(
-                {"_id": guild.id}, {"_id": guild.id, "otp_in": False}
-            )
+            await self._disable_otp(guild.id)
             return False
 
         if target.top_role > guild.me.top_role:
             return False
         else:
-            roles = [r for r in target.roles if r.id != guild.default_role.id]
-            if not roles:
+            default_id = guild.default_role.id
+            role_ids = [r.id for r in target.roles if r.id != default_id]
+            if not role_ids:
                 return True
             try:
+                # remove_roles accepts bare snowflakes; no need to hold the
+                # Role objects across the HTTP call
                 await target.remove_roles(
-                    *roles,
+                    *map(discord.Object, role_ids),
                     atomic=False,
                     reason=f"Role(s) Stripped to apply Report {case_id}'s Action!"
                     f" Run /config restore-roles [user] to undo this.",
@@ -439,16 +536,13 @@ class GlobalActions(commands.Cog):
                     {"_id": target.id},
                     {
                         "_id": target.id,
-                        "roles": [r.id for r in roles],
-                        "when": datetime.datetime.now().timestamp(),
+                        "roles": role_ids,
+                        "when": time.time(),
                     },
                 )
                 return True
             except discord.Forbidden:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id}, {"_id": guild.id, "otp_in": False}
-                )
+                await self._disable_otp(guild.id)
                 return False
             except discord.HTTPException:
                 return False
@@ -477,12 +571,15 @@ class GlobalActions(commands.Cog):
         else:
             reason = f"Role restoration executed by {authorised_by.name}! skip harmful roles: {skip_harmful}"
         if skip_harmful:
-            to_add = []
-            for role in roles:
-                safe = role.permissions & HARMFUL_PERMISSIONS
-                safe = not safe
-                if safe:
-                    to_add.append(role)
+            harmful = self.harmful_role_ids.get(guild.id)
+            if harmful is None:
+                # guild joined after the boot-time cache was built
+                harmful = self.harmful_role_ids[guild.id] = {
+                    r.id
+                    for r in guild.roles
+                    if r.permissions.value & _HARMFUL_MASK
+                }
+            to_add = [r for r in roles if r.id not in harmful]
             await target.add_roles(*to_add, reason=reason, atomic=False)
         else:
             await target.add_roles(*roles, reason=reason, atomic=False)
@@ -491,43 +588,30 @@ class GlobalActions(commands.Cog):
     async def send_to_modlog(
         self, guild: discord.Guild, content: str, embed: discord.Embed
     ) -> bool:
-        # check if a new webhook is already being created:
-        result = self.webhook_creation_lock.get(guild.id, None)
-        if result:
-            assert isinstance(result, asyncio.Event)
-            if not result.is_set():
-                try:
-                    await asyncio.wait_for(result.wait(), timeout=60)
-                except asyncio.TimeoutError:
-                    # waited too long, something must be wrong (highly unlikely)
-                    # reset the guild's webhook creation lock
-                    try:
-                        del self.webhook_creation_lock[guild.id]
-                    except KeyError:
-                        pass
-                    return False
-        modlog_channel = self.guild_config[guild.id]["modlog_channel"]
+        cfg = self.guild_config[guild.id]
+        modlog_channel = cfg["modlog_channel"]
         if not modlog_channel:
             return False
         # modlog_channel = self.bot.get_channel(modlog_channel)
         # if not modlog_channel:
         #     return False
-        modlog_webhook = self.guild_config[guild.id]["modlog_webhook"]
+        modlog_webhook = cfg["modlog_webhook"]
+        # permissions_for walks the channel overwrites; resolve once and
+        # share the result between the send paths below
+        my_perms = modlog_channel.permissions_for(guild.me)
 
         async def disable_modlog_and_notify():
             nonlocal content
             nonlocal embed
 
-            self.guild_config[guild.id]["modlog_channel"] = None
+            cfg["modlog_channel"] = None
             await self.bot.db.global_actions.upsert(
                 {"_id": guild.id},
                 {"_id": guild.id, "modlog_channel": None, "modlog_webhook": None},
             )
+            self.bot.dispatch("ga_config_overwrite", guild.id)
 
-            if (
-                modlog_channel.permissions_for(guild.me).send_messages
-                and modlog_channel.permissions_for(guild.me).embed_links
-            ):
+            if my_perms.send_messages and my_perms.embed_links:
                 try:
                     await modlog_channel.send(content=content, embed=embed)
                 except discord.Forbidden:
@@ -564,7 +648,7 @@ class GlobalActions(commands.Cog):
                     content=content,
                     embed=embed,
                     username="DDA logs",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    allowed_mentions=_NO_MENTIONS,
                 )
             except (discord.Forbidden, discord.NotFound):
                 failed_flag = True
@@ -572,59 +656,75 @@ class GlobalActions(commands.Cog):
                 return False  # Something went wrong, but webhook was fine
 
         if not modlog_webhook or failed_flag:
-            if not modlog_channel.permissions_for(guild.me).manage_webhooks:
+            if not my_perms.manage_webhooks:
                 await disable_modlog_and_notify()
                 return False
 
             else:
-                # create a lock first
-                if self.webhook_creation_lock.get(guild.id):
-                    self.webhook_creation_lock[guild.id].clear()
-                else:
-                    self.webhook_creation_lock[guild.id] = asyncio.Event()
-                # now try to create a new webhook
+                # serialise webhook creation per guild; concurrent senders
+                # queue on the lock instead of racing to create duplicates
+                if (lock := self.webhook_creation_lock.get(guild.id)) is None:
+                    lock = self.webhook_creation_lock[guild.id] = asyncio.Lock()
                 try:
-                    modlog_webhook = await modlog_channel.create_webhook(
-                        name="DDA logs",
-                        avatar=self.webhook_avatar,
-                        reason="Create Modlog webhook for DDA logs!",
-                    )
-                except (discord.HTTPException, discord.Forbidden):
-                    await disable_modlog_and_notify()
-                    self.webhook_creation_lock[guild.id].set()
+                    await asyncio.wait_for(lock.acquire(), timeout=60)
+                except asyncio.TimeoutError:
+                    # waited too long, something must be wrong (highly unlikely)
+                    # reset the guild's webhook creation lock
+                    self.webhook_creation_lock.pop(guild.id, None)
                     return False
-
-                # try to use the webhook (maybe wick or someone else deletes it)
-                await asyncio.sleep(2)  # sleep to ensure it is safe to use
-                # that is if wick was to delete it, it would be done by now
                 try:
-                    await modlog_webhook.send(
-                        content=content,
-                        embed=embed,
-                        username="DDA logs",
-                        allowed_mentions=discord.AllowedMentions.none(),
-                    )
-                except (discord.Forbidden, discord.NotFound):
-                    await disable_modlog_and_notify()
-                    self.webhook_creation_lock[guild.id].set()
-                    return False
-                except discord.HTTPException:
-                    self.webhook_creation_lock[guild.id].set()
-                    return False  # Something went wrong, but webhook was fine
+                    # another sender may have finished creating a webhook
+                    # while we were queued on the lock
+                    current = cfg["modlog_webhook"]
+                    if current is not None and current is not modlog_webhook:
+                        try:
+                            await current.send(
+                                content=content,
+                                embed=embed,
+                                username="DDA logs",
+                                allowed_mentions=_NO_MENTIONS,
+                            )
+                            return True
+                        except (discord.Forbidden, discord.NotFound):
+                            pass  # stale already; recreate below
+                        except discord.HTTPException:
+                            return False
 
-                # new webhook created successfully
-                self.guild_config[guild.id]["modlog_webhook"] = modlog_webhook
-                await self.bot.db.global_actions.upsert(
-                    {
-                        "_id": guild.id,
-                    },
-                    {"modlog_webhook": modlog_webhook.url},
-                )
-                self.webhook_creation_lock[guild.id].set()
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id},
-                    {"_id": guild.id, "modlog_webhook": modlog_webhook.url},
-                )
+                    # now try to create a new webhook
+                    try:
+                        modlog_webhook = await modlog_channel.create_webhook(
+                            name="DDA logs",
+                            avatar=self.webhook_avatar,
+                            reason="Create Modlog webhook for DDA logs!",
+                        )
+                    except (discord.HTTPException, discord.Forbidden):
+                        await disable_modlog_and_notify()
+                        return False
+
+                    # try to use the webhook (maybe wick or someone else deletes it)
+                    await asyncio.sleep(2)  # sleep to ensure it is safe to use
+                    # that is if wick was to delete it, it would be done by now
+                    try:
+                        await modlog_webhook.send(
+                            content=content,
+                            embed=embed,
+                            username="DDA logs",
+                            allowed_mentions=_NO_MENTIONS,
+                        )
+                    except (discord.Forbidden, discord.NotFound):
+                        await disable_modlog_and_notify()
+                        return False
+                    except discord.HTTPException:
+                        return False  # Something went wrong, but webhook was fine
+
+                    # new webhook created successfully
+                    cfg["modlog_webhook"] = modlog_webhook
+                    await self.bot.db.global_actions.upsert(
+                        {"_id": guild.id},
+                        {"_id": guild.id, "modlog_webhook": modlog_webhook.url},
+                    )
+                finally:
+                    lock.release()
 
     async def guild_sanction(
         self,
@@ -643,13 +743,14 @@ class GlobalActions(commands.Cog):
         None - Sanction doesn't apply ( user not a member of guild )
 
         """
-        if guild.id not in self.guild_config:
-            return None
-
-        if not self.pred_otp(guild.id):
-            return None
-
-        if not self.pred_category(guild.id, category, subcategory):
+        # one config lookup covers registration, OTP status and category
+        # subscription - pred_otp/pred_category would each re-hash guild.id
+        cfg = self.guild_config.get(guild.id)
+        if (
+            cfg is None
+            or not cfg["otp_in"]
+            or not cfg["categories"].get(category, _EMPTY).get(subcategory)
+        ):
             return None
 
         if actiontype == Actions.NONE:
@@ -658,114 +759,152 @@ class GlobalActions(commands.Cog):
         if actiontype == Actions.WARN:
             return True  # This will simply be a single DM not a DM per Guild
 
+        # human_timedelta is pure for a given expiry; format it once and
+        # thread it through the reason strings and modlog helpers below
+        humanized: Optional[str] = None
+        if expires is not None:
+            humanized = human_timedelta(expires, suffix=False, accuracy=4)
+
         member = guild.get_member(target.id)
         if member:
             target: discord.Member = member
 
-        if actiontype == Actions.BAN:
-            if isinstance(target, discord.Member):
-                if target == guild.owner:  # noqa: ignore
-                    return False
-                elif target.top_role > guild.me.top_role:
-                    return False
-                result = await self.strip_and_save(guild, target, case_id)
-                await self.on_strip(guild, target, case_id, expires, result)
-                if not result:
-                    return False
-            try:
-                if expires:
-                    reason = (
-                        f"User Banned  for {human_timedelta(expires, suffix=False, accuracy=4)} "
-                        f"[Report {case_id}'s Action]!"
-                    )
-                    reason = "".join(reason)
-                else:
-                    reason = f"User Banned [Report {case_id}'s Action]!"
-                await guild.ban(target, reason=reason)
-                return True
-            except discord.Forbidden:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id}, {"_id": guild.id, "otp_in": False}
-                )
-                return False
-            except discord.HTTPException:
-                return False
+        handler = self._action_handlers.get(actiontype)
+        if handler is None:
+            return True
+        return await handler(guild, cfg, target, case_id, expires, humanized)
 
-        elif actiontype == Actions.KICK:
-            if not isinstance(target, discord.Member):
-                return True
-            if target == guild.owner:  # noqa: ignore
-                return False
-            elif target.top_role > guild.me.top_role:
-                return False
+    @staticmethod
+    def _sanction_precheck(
+        guild: discord.Guild, target: discord.Member
+    ) -> Optional[bool]:
+        """Shared owner/hierarchy guards; None means the sanction may proceed."""
+        if target == guild.owner:  # noqa: ignore
+            return False
+        if target.top_role > guild.me.top_role:
+            return False
+        return None
+
+    async def _do_ban(
+        self,
+        guild: discord.Guild,
+        cfg: GuildConfig,
+        target: discord.Member | discord.User,
+        case_id: int,
+        expires: Optional[datetime.datetime],
+        humanized: Optional[str],
+    ) -> bool:
+        if isinstance(target, discord.Member):
+            precheck = self._sanction_precheck(guild, target)
+            if precheck is not None:
+                return precheck
             result = await self.strip_and_save(guild, target, case_id)
-            await self.on_strip(guild, target, case_id, expires, result)
+            await self.on_strip(guild, target, case_id, expires, result, humanized)
             if not result:
                 return False
-            try:
-                await target.kick(reason=f"User Kicked [Report {case_id}'s Action!]")
-                return True
-            except discord.Forbidden:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id}, {"_id": guild.id, "otp_in": False}
+        try:
+            if expires:
+                reason = (
+                    f"User Banned  for {humanized} "
+                    f"[Report {case_id}'s Action]!"
                 )
-                return False
-            except discord.HTTPException:
-                return False
-
-        elif actiontype == Actions.QUARANTINE:
-            if not isinstance(target, discord.Member):
-                return True
-            if target == guild.owner:
-                return False
-            # first check quarantine role exists.
-            quarantine_role = self.guild_config[guild.id]["quarantine_role"]
-            if quarantine_role:
-                quarantine_role = guild.get_role(quarantine_role)
-                if not quarantine_role:
-                    self.guild_config[guild.id]["otp_in"] = False
-                    self.guild_config[guild.id]["quarantine_role"] = None
-                    await self.bot.db.global_actions.upsert(
-                        {"_id": guild.id},
-                        {"_id": guild.id, "otp_in": False, "quarantine_role": None},
-                    )
-                    return False
+            else:
+                reason = f"User Banned [Report {case_id}'s Action]!"
+            await guild.ban(target, reason=reason)
+            return True
+        except discord.Forbidden:
+            await self._disable_otp(guild.id)
+            return False
+        except discord.HTTPException:
+            return False
 
-                result = await self.strip_and_save(guild, target, case_id)
-                await self.on_strip(guild, target, case_id, expires, result)
-                if not result:
-                    return False
-                await target.add_roles(
-                    quarantine_role,
-                    reason=f"User Quarantined for {human_timedelta(expires, suffix=False, accuracy=4)}"
-                    f" [Report {case_id}'s Action]!",
-                )
+    async def _do_kick(
+        self,
+        guild: discord.Guild,
+        cfg: GuildConfig,
+        target: discord.Member | discord.User,
+        case_id: int,
+        expires: Optional[datetime.datetime],
+        humanized: Optional[str],
+    ) -> bool:
+        if not isinstance(target, discord.Member):
+            return True
+        precheck = self._sanction_precheck(guild, target)
+        if precheck is not None:
+            return precheck
+        result = await self.strip_and_save(guild, target, case_id)
+        await self.on_strip(guild, target, case_id, expires, result, humanized)
+        if not result:
+            return False
+        try:
+            await target.kick(reason=f"User Kicked [Report {case_id}'s Action!]")
+            return True
+        except discord.Forbidden:
+            await self._disable_otp(guild.id)
+            return False
+        except discord.HTTPException:
+            return False
 
-        elif actiontype == Actions.MUTE:
-            if not isinstance(target, discord.Member):
-                return True
-            if target == guild.owner:
-                return False
-            if target.guild_permissions.administrator:
-                return False
-            if not guild.me.guild_permissions.moderate_members:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id}, {"_id": guild.id, "otp_in": False}
-                )
+    async def _do_quarantine(
+        self,
+        guild: discord.Guild,
+        cfg: GuildConfig,
+        target: discord.Member | discord.User,
+        case_id: int,
+        expires: Optional[datetime.datetime],
+        humanized: Optional[str],
+    ) -> bool:
+        if not isinstance(target, discord.Member):
+            return True
+        if target == guild.owner:
+            return False
+        # first check quarantine role exists.
+        quarantine_role = cfg["quarantine_role"]
+        if quarantine_role:
+            quarantine_role = guild.get_role(quarantine_role)
+            if not quarantine_role:
+                await self._disable_otp(guild.id, quarantine_role=None)
                 return False
+
             result = await self.strip_and_save(guild, target, case_id)
+            await self.on_strip(guild, target, case_id, expires, result, humanized)
             if not result:
                 return False
-            await target.timeout(
-                expires,
-                reason=f"User Muted for {human_timedelta(expires, suffix=False, accuracy=4)}"
+            await target.add_roles(
+                quarantine_role,
+                reason=f"User Quarantined for {humanized}"
                 f" [Report {case_id}'s Action]!",
             )
         return True
 
+    async def _do_mute(
+        self,
+        guild: discord.Guild,
+        cfg: GuildConfig,
+        target: discord.Member | discord.User,
+        case_id: int,
+        expires: Optional[datetime.datetime],
+        humanized: Optional[str],
+    ) -> bool:
+        if not isinstance(target, discord.Member):
+            return True
+        if target == guild.owner:
+            return False
+        if target.guild_permissions.administrator:
+            return False
+        if not guild.me.guild_permissions.moderate_members:
+            await self._disable_otp(guild.id)
+            return False
+        result = await self.strip_and_save(guild, target, case_id)
+        if not result:
+            return False
+        await target.timeout(
+            expires,
+            reason=f"User Muted for {humanized}"
+            f" [Report {case_id}'s Action]!",
+        )
+        return True
+
     async def sanction(
         self,
         scope: ScopeTypes,
@@ -798,20 +937,25 @@ class GlobalActions(commands.Cog):
         # This line seems to error so commented out
 
         if scope == ScopeTypes.GLOBAL:
+            gc = self.guild_config
             guilds = [
                 g
                 for g in self.bot.guilds
-                if g.id in self.guild_config and self.guild_config[g.id]["otp_in"]
+                if (cfg := gc.get(g.id)) is not None and cfg["otp_in"]
             ]
             stats["total"] = len(guilds)
 
         elif scope == ScopeTypes.MUTUAL:
+            # materialise once; the old per-guild list rebuild made this
+            # scan O(guilds * mutual_guilds)
+            mutual_ids = {tg.id for tg in target.mutual_guilds}
+            gc = self.guild_config
             guilds = [
                 g
                 for g in self.bot.guilds
-                if g.id in self.guild_config
-                and self.guild_config[g.id]["otp_in"]
-                and g.id in [tg.id for tg in target.mutual_guilds]
+                if g.id in mutual_ids
+                and (cfg := gc.get(g.id)) is not None
+                and cfg["otp_in"]
             ]
             stats["total"] = len(guilds)
 
@@ -819,102 +963,114 @@ class GlobalActions(commands.Cog):
             return stats
 
         now = discord.utils.utcnow()
+        humanized = (
+            human_timedelta(expires, suffix=False, accuracy=4)
+            if expires is not None
+            else None
+        )
 
-        for guild in guilds:
-            result = await self.guild_sanction(
-                guild, category, subcategory, actiontype, target, case_id, expires
-            )
-            if result is True:
-                if expires or actiontype in [
-                    Actions.BAN,
-                    Actions.KICK,
-                    Actions.QUARANTINE,
-                ]:
-                    # check if user already has a sanction with the same action-type and delete them
-                    await self.bot.db.sanctions.delete(
-                        {
-                            "guild": guild.id,
-                            "target": target.id,
-                            "actiontype": actiontype.value,
-                        }
-                    )
-                    # now insert the latest sanction for that sanction-type.
-                    await self.bot.db.sanctions.insert(
-                        {
-                            "guild": guild.id,
-                            "target": target.id,
-                            "category": category,
-                            "subcategory": subcategory,
-                            "actiontype": actiontype.value,
-                            "created": now,
-                            "expires": expires,
-                            "case_id": case_id,
-                        }
-                    )
-                    # generate snowflake
-                    if guild.id not in self.sanction_cache:
-                        self.sanction_cache[guild.id] = {}
-                    self.sanction_cache[guild.id][generate_snowflake()] = {
-                        "target": target.id,
-                        "actiontype": actiontype.value,
-                        "created": now,
-                        "expires": expires,
-                        "case_id": case_id,
-                        "category": category,
-                        "subcategory": subcategory,
-                    }
-                    if expires:
-                        await self.bot.reminder.create_timer(
-                            expires.replace(tzinfo=datetime.timezone.utc),
-                            "sanction",
-                            guild=guild.id,
+        # everything below only varies in `guild`; resolve the constants and
+        # attribute chains once instead of per task
+        needs_persist = bool(expires) or actiontype in _PERSIST_TYPES
+        sanctions_upsert = self.bot.db.sanctions.upsert
+        create_timer = self.bot.reminder.create_timer if expires else None
+        cache = self.sanction_cache
+        by_key = self.sanction_by_key
+
+        # fan the per-guild work out concurrently; the semaphore keeps us
+        # from hammering the API with thousands of simultaneous requests
+        sem = asyncio.Semaphore(20)
+
+        async def _apply(guild: discord.Guild) -> Optional[bool]:
+            async with sem:
+                result = await self.guild_sanction(
+                    guild, category, subcategory, actiontype, target, case_id, expires
+                )
+                if result is True:
+                    if needs_persist:
+                        # replace any sanction with the same action-type in a
+                        # single round-trip; the old delete+insert pair also
+                        # left a window where the row briefly didn't exist
+                        await sanctions_upsert(
+                            {
+                                "guild": guild.id,
+                                "target": target.id,
+                                "actiontype": actiontype.value,
+                            },
+                            {
+                                "guild": guild.id,
+                                "target": target.id,
+                                "category": category,
+                                "subcategory": subcategory,
+                                "actiontype": actiontype.value,
+                                "created": now,
+                                "expires": expires,
+                                "case_id": case_id,
+                            },
+                        )
+                        # generate snowflake
+                        entry = SanctionEntry(
+                            _id=generate_snowflake(),
                             target=target.id,
                             actiontype=actiontype.value,
+                            created=now,
+                            expires=expires,
                             case_id=case_id,
+                            category=category,
+                            subcategory=subcategory,
                         )
+                        cache.setdefault((guild.id, target.id), []).append(entry)
+                        by_key[
+                            (guild.id, target.id, actiontype.value, case_id)
+                        ] = entry
+                        if expires:
+                            await create_timer(
+                                expires.replace(tzinfo=datetime.timezone.utc),
+                                "sanction",
+                                guild=guild.id,
+                                target=target.id,
+                                actiontype=actiontype.value,
+                                case_id=case_id,
+                            )
 
+                if result is not None and actiontype.value != 0:
+                    # send webhook logs to the guild
+                    await self.on_action(
+                        guild,
+                        target,
+                        actiontype,
+                        case_id,
+                        category,
+                        subcategory,
+                        result,
+                        expires,
+                        humanized,
+                    )
+                return result
+
+        results = await asyncio.gather(
+            *(_apply(g) for g in guilds), return_exceptions=True
+        )
+        # aggregate outside the tasks so stats is never mutated concurrently
+        for guild, result in zip(guilds, results):
+            if isinstance(result, BaseException):
+                log.warning(
+                    "sanction fan-out failed for guild %s", guild.id, exc_info=result
+                )
+                stats["failure"] += 1
+            elif result is True:
                 stats["success"] += 1
                 stats["guild_ids"].append(guild.id)
             elif result is False:
                 stats["failure"] += 1
-
-            if result is not None and actiontype.value != 0:
-                # send webhook logs to the guild
-                await self.on_action(
-                    guild,
-                    target,
-                    actiontype,
-                    case_id,
-                    category,
-                    subcategory,
-                    result,
-                    expires,
-                )
         # send the result to the author's DM
-        if actiontype.value == 0:
-            description = (
-                f"Your account was reported in case number {case_id} to DDA!\n"
-                f"We found you to not be involved / deserving of any actions as a consequence of this case!\n"
-                f"**Note**: We are not discord, but a organisation on its platform that represents over {stats['total']:,} servers "
-            )
-        elif actiontype.value == 1:
-            # warn
-            description = (
-                f"Your account was reported in case number {case_id} to DDA!\n"
-                f"We have decided to **warn** you to not break our terms in servers that are represented by us!\n"
-                f"**Note**: We are not discord, but a organisation on its platform that represents over {stats['total']:,} servers "
-            )
-        else:
-            duration = None
-            if expires:
-                duration = human_timedelta(expires, suffix=False, accuracy=4)
-            description = (
-                f"Your account was reported in case number {case_id} to DDA!\n"
-                f"The following actions were performed on your account: **{str(actiontype)}** in {stats['success']:,} Servers\n"
-                + (f"**Duration**: {duration}\n" if duration else "")
-                + f"[Appeal Here](https://discord.gg/vZVq7WX9SD)\n"
-                f"**Note**: We are not discord, but a organisation on its platform that represents over {stats['total']:,} servers "
-            )
+        description = _DESC_TEMPLATES.get(actiontype.value, _DESC_ACTIONED).format(
+            case_id=case_id,
+            total=stats["total"],
+            success=stats["success"],
+            actiontype=str(actiontype),
+            duration=f"**Duration**: {humanized}\n" if humanized else "",
+        )
         embed = discord.Embed(
             title="Discord Defence Association Notice",
             description=description,
@@ -945,12 +1101,42 @@ class GlobalActions(commands.Cog):
                     embed=embed,
                     allowed_mentions=discord.AllowedMentions(roles=True),
                 )
-                await message.publish()
+                # nothing downstream needs the cross-post; don't hold the
+                # sanction result hostage to its round-trip
+                asyncio.create_task(self._safe_publish(message))
             except Exception as e:
                 print("global actions.sanctions", e)
 
         return stats
 
+    @staticmethod
+    async def _safe_publish(message: discord.Message) -> None:
+        try:
+            await message.publish()
+        except discord.HTTPException as e:
+            log.warning("failed to publish stats message: %s", e)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        if role.permissions.value & _HARMFUL_MASK:
+            self.harmful_role_ids.setdefault(role.guild.id, set()).add(role.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        harmful = self.harmful_role_ids.get(role.guild.id)
+        if harmful is not None:
+            harmful.discard(role.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        harmful = self.harmful_role_ids.setdefault(after.guild.id, set())
+        if after.permissions.value & _HARMFUL_MASK:
+            harmful.add(after.id)
+        else:
+            harmful.discard(after.id)
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member) -> None:
         guild = member.guild
@@ -960,42 +1146,54 @@ class GlobalActions(commands.Cog):
             return
         if not self.guild_config[guild.id]["otp_in"]:
             return
-        if guild.id not in self.sanction_cache:
+        entries = self.sanction_cache.get((guild.id, member.id))
+        if not entries:
             return
 
+        # partition first: awaiting guild_sanction mid-iteration would let
+        # other tasks mutate the entry list under us, and the old code
+        # stopped at the first expired entry instead of pruning them all
         now = discord.utils.utcnow()
-        sanction_cache = self.sanction_cache.get(guild.id, {})
-        for _id in sanction_cache:
-            found = sanction_cache[_id]
-            if found["target"] != member.id:
-                continue
-            expires = found["expires"]
-            if expires:
-                if expires.replace(tzinfo=datetime.timezone.utc) <= now:
-                    del self.sanction_cache[guild.id][_id]
-                    return
+        expired: List[SanctionEntry] = []
+        to_apply: List[SanctionEntry] = []
+        for found in entries:
+            expires = found.expires
+            if expires and expires.replace(tzinfo=datetime.timezone.utc) <= now:
+                expired.append(found)
+            else:
+                to_apply.append(found)
+
+        for found in expired:
+            entries.remove(found)
+            self.sanction_by_key.pop(
+                (guild.id, member.id, found.actiontype, found.case_id),
+                None,
+            )
+        if not entries:
+            del self.sanction_cache[(guild.id, member.id)]
 
-            if found["actiontype"] != Actions.MUTE.value and member.is_timed_out():
-                return
+        for found in to_apply:
+            if found.actiontype != Actions.MUTE.value and member.is_timed_out():
+                continue
 
             result = await self.guild_sanction(
                 guild,
-                found["category"],
-                found["subcategory"],
-                Actions(found["actiontype"]),
+                found.category,
+                found.subcategory,
+                ACTIONS_BY_VALUE[found.actiontype],
                 member,  # type: ignore
-                found["case_id"],
-                found["expires"],
+                found.case_id,
+                found.expires,
             )
             await self.on_action(
                 guild,
                 member,  # type: ignore
-                Actions(found["actiontype"]),
-                found["case_id"],
-                found["category"],
-                found["subcategory"],
+                ACTIONS_BY_VALUE[found.actiontype],
+                found.case_id,
+                found.category,
+                found.subcategory,
                 result,
-                found["expires"],
+                found.expires,
             )
 
     @commands.Cog.listener()
@@ -1015,110 +1213,130 @@ class GlobalActions(commands.Cog):
         member = guild.get_member(target)
 
         if actiontype == Actions.BAN:
-            result = False
-            if guild.me.guild_permissions.ban_members:
-                try:
-                    ban_entry = await guild.fetch_ban(discord.Object(id=target))
-                except (discord.Forbidden, discord.HTTPException, discord.NotFound):
-                    pass
-                else:
-                    if f"[Report {case_id}'s Action]!" in ban_entry.reason:
-                        try:
-                            await guild.unban(
-                                discord.Object(id=target),
-                                reason=f"Ban Duration ended! Case ID: {case_id}",
-                            )
-                            result = True
-                        except (
-                            discord.Forbidden,
-                            discord.NotFound,
-                            discord.HTTPException,
-                        ):
-                            pass
-
-            else:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id},
-                    {
-                        "_id": guild.id,
-                        "otp_in": False,
-                    },
+            result = bool(
+                await self._unban_target(
+                    guild,
+                    discord.Object(id=target),
+                    case_id,
+                    f"Ban Duration ended! Case ID: {case_id}",
                 )
-
+            )
             await self.on_action_expiry(
                 guild, discord.Object(id=target), actiontype, case_id, result
             )
 
         elif actiontype == Actions.QUARANTINE and member:
-            result = False
-            if guild.me.guild_permissions.manage_roles:  # noqa: ignore
-                if guild.me.top_role > member.top_role:
-                    quarantine_role = self.guild_config[guild.id]["quarantine_role"]
-                    if quarantine_role:
-                        quarantine_role = guild.get_role(quarantine_role)
-                        if not quarantine_role:
-                            self.guild_config[guild.id]["otp_in"] = False
-                            self.guild_config[guild.id]["quarantine_role"] = None
-                            await self.bot.db.global_actions.upsert(
-                                {"_id": guild.id},
-                                {
-                                    "_id": guild.id,
-                                    "otp_in": False,
-                                    "quarantine_role": None,
-                                },
-                            )
-                        else:
-                            try:
-                                await member.remove_roles(
-                                    quarantine_role,
-                                    reason=f"Quarantine Duration ended! Case ID: {case_id}",
-                                )
-                                result = True
-                            except (discord.Forbidden, discord.HTTPException):
-                                pass
-                            restore_result = await self.restore_from_save(
-                                guild, member, case_id=case_id
-                            )
-                            await self.on_restore(
-                                guild, member, case_id, restore_result
-                            )
-            else:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id},
-                    {"_id": guild.id, "otp_in": False, "quarantine_role": None},
-                )
-
+            result = await self._unquarantine_member(
+                guild,
+                member,
+                case_id,
+                f"Quarantine Duration ended! Case ID: {case_id}",
+            )
             await self.on_action_expiry(
-                guild, member, Actions(actiontype), case_id, result
+                guild, member, ACTIONS_BY_VALUE[actiontype], case_id, result
             )
         elif actiontype == Actions.MUTE and member:
             # when action-type.Mute we don't need to unmute as that is handled by discord
             # However we need to give their roles back!
-            restore_result = await self.restore_from_save(
-                guild, member, case_id=case_id
-            )
-            await self.on_restore(guild, member, case_id, restore_result)
+            await self._restore_and_log(guild, member, case_id)
 
         # delete the sanction
 
         await self.delete_sanction(guild, target, actiontype, case_id)
 
+    async def _unban_target(
+        self,
+        guild: discord.Guild,
+        user: discord.abc.Snowflake,
+        case_id: int,
+        reason: str,
+        *,
+        exact_match: bool = False,
+    ) -> Optional[bool]:
+        """Lifts the ban applied for ``case_id``.
+
+        Returns True on success, False on failure and None when the ban was
+        not placed by this case's action (with ``exact_match`` the stored
+        reason must equal ours, otherwise it only has to contain the case
+        marker).
+        """
+        if not guild.me.guild_permissions.ban_members:
+            await self._disable_otp(guild.id)
+            return False
+        # build the needle once up front; bans placed manually can carry a
+        # None reason, so guard before substring-testing it
+        marker = f"[Report {case_id}'s Action]!"
+        try:
+            ban_entry = await guild.fetch_ban(user)
+        except (discord.Forbidden, discord.HTTPException, discord.NotFound):
+            return False
+        if exact_match:
+            if ban_entry.reason != f"User Banned {marker}":
+                return None
+        elif not (ban_entry.reason and marker in ban_entry.reason):
+            return None
+        try:
+            await guild.unban(user, reason=reason)
+            return True
+        except (discord.Forbidden, discord.NotFound, discord.HTTPException):
+            return False
+
+    async def _unquarantine_member(
+        self,
+        guild: discord.Guild,
+        member: discord.Member,
+        case_id: int,
+        reason: str,
+    ) -> bool:
+        """Removes the quarantine role and restores saved roles."""
+        result = False
+        # guild.me walks the member cache and guild_permissions recomputes;
+        # resolve once for the two checks below
+        me = guild.me
+        if me.guild_permissions.manage_roles:  # noqa: ignore
+            if me.top_role > member.top_role:
+                quarantine_role = self.guild_config[guild.id]["quarantine_role"]
+                if quarantine_role:
+                    quarantine_role = guild.get_role(quarantine_role)
+                    if not quarantine_role:
+                        await self._disable_otp(guild.id, quarantine_role=None)
+                    else:
+                        try:
+                            await member.remove_roles(quarantine_role, reason=reason)
+                            result = True
+                            # only restore once the quarantine role actually
+                            # came off; a failed removal used to pay the DB
+                            # read and role edits regardless
+                            await self._restore_and_log(guild, member, case_id)
+                        except (discord.Forbidden, discord.HTTPException):
+                            pass
+        else:
+            await self._disable_otp(guild.id, quarantine_role=None)
+        return result
+
+    async def _restore_and_log(
+        self, guild: discord.Guild, member: discord.Member, case_id: int
+    ) -> bool:
+        restore_result = await self.restore_from_save(guild, member, case_id=case_id)
+        await self.on_restore(guild, member, case_id, restore_result)
+        return restore_result
+
     async def delete_sanction(
         self, guild: discord.Guild, target: int, actiontype: str, case_id: int
     ):
-        try:
-            for _id in self.sanction_cache[guild.id]:
-                found = self.sanction_cache[guild.id][_id]
-                if (
-                    found["target"] == target
-                    and found["actiontype"] == actiontype
-                    and found["case_id"] == case_id
-                ):
-                    del self.sanction_cache[guild.id][_id]
-        except KeyError:
-            pass
+        entry = self.sanction_by_key.pop(
+            (guild.id, target, actiontype, case_id), None
+        )
+        if entry is not None:
+            key = (guild.id, target)
+            entries = self.sanction_cache.get(key)
+            if entries:
+                try:
+                    entries.remove(entry)
+                except ValueError:
+                    pass
+                if not entries:
+                    del self.sanction_cache[key]
 
         await self.bot.db.sanctions.delete(
             {
@@ -1145,74 +1363,26 @@ class GlobalActions(commands.Cog):
         if appealtype == AppealActions.UNBAN:
             if isinstance(target, discord.Member):
                 result = True  # they are already unbanned
-            elif guild.me.guild_permissions.ban_members:
-                try:
-                    ban_entry = await guild.fetch_ban(target)
-                except (discord.Forbidden, discord.HTTPException, discord.NotFound):
-                    pass
-                else:
-                    if (
-                        not ban_entry.reason
-                        == f"User Banned [Report {case_id}'s Action]!"
-                    ):
-                        return False
-                    try:
-                        await guild.unban(
-                            target, reason=f"Appeal Accepted for case ID: {case_id}"
-                        )
-                        result = True
-                    except (discord.Forbidden, discord.NotFound, discord.HTTPException):
-                        pass
-
             else:
-                self.guild_config[guild.id]["otp_in"] = False
-                await self.bot.db.global_actions.upsert(
-                    {"_id": guild.id},
-                    {
-                        "_id": guild.id,
-                        "otp_in": False,
-                    },
+                result = await self._unban_target(
+                    guild,
+                    target,
+                    case_id,
+                    f"Appeal Accepted for case ID: {case_id}",
+                    exact_match=True,
                 )
+                if result is None:
+                    # ban wasn't placed by this case; nothing to appeal here
+                    return False
 
         elif appealtype == AppealActions.UNQUARANTINE:
             if isinstance(target, discord.Member):
-                if guild.me.guild_permissions.manage_roles:  # noqa: ignore
-                    if guild.me.top_role > member.top_role:
-                        quarantine_role = self.guild_config[guild.id]["quarantine_role"]
-                        if quarantine_role:
-                            quarantine_role = guild.get_role(quarantine_role)
-                            if not quarantine_role:
-                                self.guild_config[guild.id]["otp_in"] = False
-                                self.guild_config[guild.id]["quarantine_role"] = None
-                                await self.bot.db.global_actions.upsert(
-                                    {"_id": guild.id},
-                                    {
-                                        "_id": guild.id,
-                                        "otp_in": False,
-                                        "quarantine_role": None,
-                                    },
-                                )
-                            else:
-                                try:
-                                    await member.remove_roles(
-                                        quarantine_role,
-                                        reason=f"Appeal Accepted for Case ID: {case_id}",
-                                    )
-                                    result = True
-                                except (discord.Forbidden, discord.HTTPException):
-                                    pass
-                                restore_result = await self.restore_from_save(
-                                    guild, member, case_id=case_id
-                                )
-                                await self.on_restore(
-                                    guild, member, case_id, restore_result
-                                )
-                else:
-                    self.guild_config[guild.id]["otp_in"] = False
-                    await self.bot.db.global_actions.upsert(
-                        {"_id": guild.id},
-                        {"_id": guild.id, "otp_in": False, "quarantine_role": None},
-                    )
+                result = await self._unquarantine_member(
+                    guild,
+                    member,
+                    case_id,
+                    f"Appeal Accepted for Case ID: {case_id}",
+                )
 
         elif appealtype == AppealActions.UNMUTE:
             if isinstance(target, discord.Member):
@@ -1222,10 +1392,7 @@ class GlobalActions(commands.Cog):
                     try:
                         await member.edit(timed_out_until=None)
                         result = True
-                        restore_result = await self.restore_from_save(
-                            guild, target, case_id=case_id
-                        )
-                        await self.on_restore(guild, member, case_id, restore_result)
+                        await self._restore_and_log(guild, member, case_id)
                     except (discord.Forbidden, discord.HTTPException):
                         pass
 
@@ -1264,34 +1431,52 @@ class GlobalActions(commands.Cog):
         if len(guilds) < 1:
             return stats
 
-        for guild in guilds:
-            result = await self.guild_appeal(
-                guild, target, appealtype, category, subcategory, case_id
-            )
+        sem = asyncio.Semaphore(20)
 
-            # await self.bot.db.sanctions.delete({
-            #     "guild": guild.id,
-            #     "target": target.id,
-            #     "actiontype": actiontype.value
-            # })
+        async def _apply(guild: discord.Guild) -> bool:
+            async with sem:
+                result = await self.guild_appeal(
+                    guild, target, appealtype, category, subcategory, case_id
+                )
 
-            await self.delete_sanction(guild, target.id, str(actiontype), case_id)
+                # await self.bot.db.sanctions.delete({
+                #     "guild": guild.id,
+                #     "target": target.id,
+                #     "actiontype": actiontype.value
+                # })
+
+                await self.delete_sanction(guild, target.id, str(actiontype), case_id)
+
+                if result is not None:
+                    # send webhook logs to the guild
+                    await self.on_appeal(
+                        guild,
+                        target,
+                        appealtype,
+                        category,
+                        subcategory,
+                        case_id,
+                        result,
+                    )
+                return result
 
-            stats["success"] += 1
-            if result:
-                stats["success"] += 1
-            elif result is False:
-                stats["failure"] += 1
-            if result is not None:
-                # send webhook logs to the guild
-                await self.on_appeal(
-                    guild,
-                    target,
-                    appealtype,
-                    category,
-                    subcategory,
-                    case_id,
-                    result,
+        results = await asyncio.gather(
+            *(_apply(g) for g in guilds), return_exceptions=True
+        )
+        # local accumulators: the old loop bumped stats["success"] for every
+        # guild and then again on success, double-counting the wins
+        success = failure = 0
+        for guild, result in zip(guilds, results):
+            if isinstance(result, BaseException):
+                log.warning(
+                    "appeal fan-out failed for guild %s", guild.id, exc_info=result
                 )
+                failure += 1
+            elif result:
+                success += 1
+            elif result is False:
+                failure += 1
+        stats["success"] = success
+        stats["failure"] = failure
 
         return stats
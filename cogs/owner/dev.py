@@ -49,7 +49,7 @@ class Developer(commands.Cog):
         if user.id in self.bot.admins:
             return await ctx.reply(f"{user.mention} is already a bot admin.")
         else:
-            self.bot.admins.append(user.id)
+            self.bot.admins.add(user.id)
             await ctx.bot.db.admins.insert(
                 {
                     "_id": user.id,
@@ -62,7 +62,7 @@ class Developer(commands.Cog):
         if user.id not in self.bot.admins:
             return await ctx.reply(f"{user.mention} is not a bot admin.")
         else:
-            self.bot.admins.remove(user.id)
+            self.bot.admins.discard(user.id)
             await ctx.bot.db.admins.delete(
                 {
                     "_id": user.id,
@@ -23,7 +23,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Set
 
 import discord
 from discord.app_commands import guilds
@@ -42,7 +42,7 @@ class Registration(commands.Cog):
     def __init__(self, bot: PhantomGuard):
         self.bot: PhantomGuard = bot
         self.member_count_requirement: int = 250
-        self.registering_guilds: List[int] = self.bot.registering_guilds
+        self.registering_guilds: Set[int] = self.bot.registering_guilds
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -95,8 +95,8 @@ class Registration(commands.Cog):
             return
 
         cog: GlobalActions
-        authorised = [gc for gc in cog.guild_config.keys()]
-        authorised.extend(self.registering_guilds)
+        authorised = set(cog.guild_config)
+        authorised.update(self.registering_guilds)
 
         if guild_id in authorised:
             guild = ctx.bot.get_guild(guild_id)
@@ -341,14 +341,13 @@ class Registration(commands.Cog):
             return
 
         gas_cog: GlobalActions
-        authorised = [gc for gc in gas_cog.guild_config.keys()]
-        # authorised.extend(self.registering_guilds)
+        authorised = set(gas_cog.guild_config)
+        # authorised.update(self.registering_guilds)
         if guild_id in authorised:
             await ctx.reply("This server is already registered!")
             return
 
-        if guild_id not in self.registering_guilds:
-            self.registering_guilds.append(guild_id)
+        self.registering_guilds.add(guild_id)
 
         guild = self.bot.get_guild(guild_id)
         if not guild:
@@ -366,7 +365,7 @@ class Registration(commands.Cog):
                 return
             humans = [mem for mem in guild.members if not mem.bot]
             if len(humans) < self.member_count_requirement:
-                self.registering_guilds.remove(guild_id)
+                self.registering_guilds.discard(guild_id)
                 await guild.leave()
                 embed = discord.Embed(
                     title="Missing Requirement",
@@ -380,7 +379,7 @@ class Registration(commands.Cog):
         quarantine_role = guild.get_role(quarantine_role_id)
 
         if not quarantine_role:
-            self.registering_guilds.remove(guild_id)
+            self.registering_guilds.discard(guild_id)
             await guild.leave()
             embed = discord.Embed(
                 title="Missing Requirement",
@@ -22,6 +22,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 from typing import TYPE_CHECKING, Dict, List, Optional
 
@@ -559,6 +560,11 @@ class Reports(commands.Cog):
             }
         )
 
+    @commands.Cog.listener()
+    async def on_poll_timer_batch_complete(self, timers: List[Timer]) -> None:
+        # fired once at startup for every poll that expired while offline
+        await asyncio.gather(*(self.on_poll_timer_complete(t) for t in timers))
+
     @commands.Cog.listener()
     async def on_draft_expiry_timer_complete(self, timer: Timer) -> None:
         data = timer.kwargs["data"]
@@ -32,7 +32,7 @@ from discord import Interaction
 from discord.ext import commands
 from discord.ui import Modal, View, button
 
-from cogs.global_actions import Actions, MaxDuration, ScopeTypes
+from cogs.global_actions import MAX_DURATION, Actions, ScopeTypes
 from utils.time import TimeTransformer, human_timedelta
 
 from .converters import GuildsConverter, UsersConverter
@@ -1022,18 +1022,18 @@ class AddSanctionModal(Modal, title="Add Sanction"):
                 )
                 now = discord.utils.utcnow()
                 duration = duration.timestamp() - now.timestamp()
-                max_duration_enum = MaxDuration.from_str(self.action.value.lower())
-                if max_duration_enum.value == 0:
+                max_days = MAX_DURATION[self.action.value.lower()]
+                if max_days == 0:
                     return await interaction.followup.send(
                         f"ERROR: The action {self.action.value.lower()} cannot have a duration!",
                         ephemeral=True,
                     )
-                max_duration = now + timedelta(days=max_duration_enum.value)
+                max_duration = now + timedelta(days=max_days)
                 max_duration = max_duration.timestamp() - now.timestamp()
                 if duration > max_duration:
                     return await interaction.followup.send(
                         f"ERROR: The action {self.action.value.lower()} must have a duration smaller than or equal to"
-                        f" {max_duration_enum.value} days!",
+                        f" {max_days} days!",
                         ephemeral=True,
                     )
             except Exception:
@@ -77,29 +77,50 @@ def custom_check(
             if ctx.guild.owner == ctx.author:
                 return True
 
-            guild_config = await ctx.bot.db.config.find({"_id": ctx.guild.id})
+            # group dispatch runs the same decorator for the parent and
+            # the subcommand; reuse anything this invocation has already
+            # established instead of hitting the db again
+            cache = getattr(ctx, "_custom_check_cache", None)
+            if cache is None:
+                cache = ctx._custom_check_cache = {}
+            key = (regowner, regadmin, regmod)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+            guild_config = cache.get("config")
+            if guild_config is None:
+                guild_config = await ctx.bot.db.config.find({"_id": ctx.guild.id})
+                cache["config"] = guild_config
 
             if regowner:
-                return ctx.author.id in guild_config["owners"] and (
+                result = ctx.author.id in guild_config["owners"] and (
                     await commands.has_permissions(administrator=True).predicate(ctx)
                 )
-            if regadmin:
-                if ctx.author.id in guild_config["owners"] and (
-                    await commands.has_permissions(administrator=True).predicate(ctx)
-                ):
-                    return True
-                return ctx.author.id in guild_config["admins"]
-            if regmod:
-                if (
+            elif regadmin:
+                result = ctx.author.id in guild_config["admins"] or (
                     ctx.author.id in guild_config["owners"]
                     and (
                         await commands.has_permissions(administrator=True).predicate(
                             ctx
                         )
                     )
-                ) or ctx.author.id in guild_config["admins"]:
-                    return True
-                return ctx.author.id in guild_config["mods"]
+                )
+            else:
+                result = (
+                    ctx.author.id in guild_config["mods"]
+                    or ctx.author.id in guild_config["admins"]
+                    or (
+                        ctx.author.id in guild_config["owners"]
+                        and (
+                            await commands.has_permissions(
+                                administrator=True
+                            ).predicate(ctx)
+                        )
+                    )
+                )
+            cache[key] = result
+            return result
 
         if check:
             # if this is true command is allowed to be bypassed / disabled